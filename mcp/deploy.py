@@ -31,18 +31,35 @@
     python3 mcp/deploy.py --delete blog/article.html
     python3 mcp/deploy.py --delete guides/article.html
     python3 mcp/deploy.py --delete article.html --target blog
+    python3 mcp/deploy.py --delete blog/a.html guides/b.html   # 批量删除，只确认一次
+
+    # 方式7：批量部署时不询问，直接覆盖（或 no 跳过）已存在的文件
+    python3 mcp/deploy.py --auto --overwrite yes
 """
 
 import os
 import re
 import sys
 import argparse
-import shutil
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from typing import Callable, Dict, List, Optional, Tuple
 import json
+from html import escape, unescape
+
+# HTML解析器：优先使用C实现的lxml（比html.parser快很多），未安装时回退到html.parser
+# 删除文章时直接用lxml.html修改索引页，未安装lxml时回退到BeautifulSoup
+try:
+    import lxml.html as lxml_html
+    from lxml import etree
+    PARSER = 'lxml'
+except ImportError:
+    lxml_html = etree = None
+    PARSER = 'html.parser'
 
 # 配置
 BLOG_DIR = Path(__file__).parent.parent / 'blog'
@@ -51,6 +68,7 @@ INDEX_HTML = Path(__file__).parent.parent / 'index.html'
 BLOG_INDEX = BLOG_DIR / 'index.html'
 GUIDES_INDEX = GUIDES_DIR / 'index.html'
 TRANSLATED_DIR = Path(__file__).parent / 'translated_articles'
+METADATA_CACHE_FILE = Path(__file__).parent / '.deploy_cache.json'
 
 # Blog和Guides的关键词（用于自动分类）
 BLOG_KEYWORDS = ['story', 'experience', 'adventure', 'journey', 'trip', 'travel', 'personal', 
@@ -59,10 +77,144 @@ GUIDES_KEYWORDS = ['guide', 'how to', 'tutorial', 'tips', 'advice', 'information
                    'essential', 'visa', 'transport', 'app', 'vpn', 'food', 'ordering',
                    '攻略', '指南', '如何', '教程', '信息']
 
+# 标题关键词 -> 图标（按顺序匹配，排在前面的优先）
+ICON_KEYWORDS = [
+    ('visa', '🛂'), ('passport', '🛂'),
+    ('train', '🚄'), ('rail', '🚄'), ('transport', '🚄'),
+    ('app', '📱'), ('wechat', '📱'), ('alipay', '📱'),
+    ('vpn', '🌐'), ('internet', '🌐'),
+    ('food', '🍜'), ('restaurant', '🍜'), ('dining', '🍜'), ('hotpot', '🌶️'),
+    ('mountain', '⛰️'), ('hiking', '🥾'), ('climb', '⛰️'),
+    ('city', '🏛️'), ('beijing', '🏛️'), ('shanghai', '🌃'), ('chengdu', '🐼'),
+    ('story', '📖'), ('experience', '❤️'), ('adventure', '🥾'),
+    ('funny', '😂'), ('humor', '😂'),
+    ('culture', '🎭'), ('cultural', '🎭'),
+]
+
+# guides/index.html 中按标题关键词选择section（按顺序匹配，排在前面的优先）
+GUIDES_SECTION_KEYWORDS = [
+    ('visa', ['visa']),
+    ('transport', ['train', 'rail', 'transport', 'metro', 'didi']),
+    ('tech', ['app', 'vpn', 'internet', 'wechat', 'alipay']),
+    ('food', ['food', 'dining', 'restaurant', 'ordering']),
+    ('cities', ['city', 'beijing', 'shanghai', 'chengdu']),
+]
+
+# 文章列表项的标签样式，按标题关键词选择（按顺序匹配，排在前面的优先），默认 tag-story
+TAG_CLASS_KEYWORDS = [
+    ('tag-guide', ['guide', 'visa']),
+    ('tag-food', ['food', 'hotpot']),
+    ('tag-adventure', ['adventure', 'hiking']),
+]
+
 # 主页显示的文章数量
 MAX_HOMEPAGE_STORIES = 5
 MAX_HOMEPAGE_GUIDES = 5
 
+# 写回索引页时的文件缓冲区大小（索引页一次性编码为bytes后写入）
+WRITE_BUFFER_SIZE = 1 << 20
+
+# 并行提取文章元数据的线程数（文件读取和lxml解析都会释放GIL）
+PARSE_WORKERS = 8
+# 批量部署时解析源文章的进程数（BeautifulSoup建树是纯Python代码，多进程才能用满多核）
+PARSE_PROCESSES = os.cpu_count() or 1
+
+# 预编译的正则（每篇文章都会用到，避免每次调用时查找/编译）
+_RE_MD_STARS = re.compile(r'\*\*')
+_RE_DATE = re.compile(r'(\w+ \d{1,2}, \d{4})')
+_RE_WS = re.compile(r'\s+')
+# 索引页中直接位于文章列表下的文章项
+_ARTICLE_ITEM_SELECTOR = '.article-list > .article-list-item'
+# 部署时修复链接：<a>开始标签，以及其中的href属性（带引号或不带引号的值）
+_RE_ANCHOR_TAG = re.compile(r'<a\s[^>]*>', re.IGNORECASE)
+_RE_HREF_ATTR = re.compile(r'((?<![\w-])href\s*=\s*)(?:(["\'])(.*?)\2|([^\s"\'=<>`]+))',
+                           re.IGNORECASE | re.DOTALL)
+# 文件名中不允许出现的字符，用str.translate一次性删除
+_FNAME_BAD_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+
+# 关键词匹配：一次正则扫描代替逐个关键词的子串查找
+_RE_GUIDES_KEYWORDS = re.compile('|'.join(map(re.escape, GUIDES_KEYWORDS)))
+_RE_BLOG_KEYWORDS = re.compile('|'.join(map(re.escape, BLOG_KEYWORDS)))
+
+
+def _compile_keyword_rules(rules: List[Tuple[str, List[str]]]):
+    """将按优先级排列的 (结果, 关键词列表) 规则编译为一个正则，返回匹配函数
+    
+    每条规则对应一个从文本开头出发的前瞻分支，分支按顺序尝试，
+    因此与逐条 `any(word in text for word in words)` 的优先级完全一致。
+    匹配函数返回第一条命中规则的结果，都不命中时返回None。
+    """
+    pattern = re.compile('|'.join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, words))}))(?P<r{i}>)"
+        for i, (_, words) in enumerate(rules)
+    ), re.DOTALL)
+    results = [result for result, _ in rules]
+    
+    def match(text: str) -> Optional[str]:
+        m = pattern.match(text)
+        return results[int(m.lastgroup[1:])] if m else None
+    
+    return match
+
+
+# 图标只取决于标题，重建索引时同一标题会多次生成列表项，缓存查找结果
+_icon_for_title = lru_cache(maxsize=4096)(
+    _compile_keyword_rules([(icon, [keyword]) for keyword, icon in ICON_KEYWORDS]))
+_guides_section_for_title = _compile_keyword_rules(GUIDES_SECTION_KEYWORDS)
+_tag_class_for_title = _compile_keyword_rules(TAG_CLASS_KEYWORDS)
+
+# 提取元数据时只解析需要的标签：<title>、<meta>以及正文所在的容器，
+# 跳过<head>中的<style>/<script>和页眉、导航、页脚等子树
+_METADATA_STRAINER = SoupStrainer(['title', 'meta', 'h1', 'div', 'article'])
+
+
+class MetadataCache:
+    """文章元数据的磁盘缓存
+    
+    以文件路径为键，记录文件的 (mtime, size) 和提取出的元数据；文件未变化时
+    直接使用缓存，不再读取和解析HTML。重建索引时加载一次、结束时保存一次。
+    """
+    VERSION = 1  # 提取逻辑变化时递增，使旧缓存失效
+    FIELDS = ('title', 'description', 'date', 'read_time', 'content_preview', 'source_url')
+    
+    def __init__(self, cache_file: Path = METADATA_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries: Dict[str, dict] = {}
+        self.dirty = False
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass  # 缓存不存在或已损坏，从空缓存开始
+    
+    def lookup(self, file_path: Path, stat: os.stat_result) -> Optional[dict]:
+        """返回文件未变化时的缓存元数据，否则返回None"""
+        entry = self.entries.get(str(file_path))
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry
+        return None
+    
+    def store(self, file_path: Path, stat: os.stat_result, article: 'ArticleMetadata'):
+        """记录文件的元数据"""
+        entry = {field: getattr(article, field) for field in self.FIELDS}
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        self.entries[str(file_path)] = entry
+        self.dirty = True
+    
+    def save(self):
+        """有新记录时写回缓存文件"""
+        if not self.dirty:
+            return
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'entries': self.entries}, f, ensure_ascii=False)
+            self.dirty = False
+        except OSError as e:
+            print(f"⚠️  保存元数据缓存失败 {self.cache_file}: {e}")
+
 
 class ArticleMetadata:
     """文章元数据"""
@@ -71,27 +223,49 @@ class ArticleMetadata:
         self.title = ""
         self.description = ""
         self.date = datetime.now().strftime('%B %d, %Y')
+        self.date_dt = self._parse_date(self.date)  # 排序用，提取日期后更新
         self.read_time = "10 min read"
         self.location = ""
         self.category = "TRAVEL STORY"
+        self.tag_class = "tag-story"  # 列表项标签样式，提取标题后更新
         self.icon = "📖"
         self.content_preview = ""
         self.source_url = ""
+        self.html_content = None
+        
+    def extract_from_html(self, keep_html: bool = False, cache: Optional[MetadataCache] = None,
+                          stat: Optional[os.stat_result] = None) -> bool:
+        """从HTML文件中提取元数据
         
-    def extract_from_html(self) -> bool:
-        """从HTML文件中提取元数据"""
+        Args:
+            keep_html: 是否保留读取到的HTML源码（self.html_content），供部署时修复路径后直接写出
+            cache: 元数据缓存，文件未变化时直接使用缓存的结果（keep_html时不使用）
+            stat: 已知的文件stat结果（如扫描目录时DirEntry缓存的），避免重复stat
+        """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            if cache is None or keep_html:
+                stat = None
+            else:
+                stat = stat or self.file_path.stat()
+                cached = cache.lookup(self.file_path, stat)
+                if cached:
+                    for field in MetadataCache.FIELDS:
+                        setattr(self, field, cached[field])
+                    self._update_derived()
+                    return True
+            
+            html_content = self.file_path.read_text(encoding='utf-8')
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if keep_html:
+                self.html_content = html_content
+            soup = BeautifulSoup(html_content, PARSER, parse_only=_METADATA_STRAINER)
             
             # 提取标题
             title_tag = soup.find('title')
             if title_tag:
                 self.title = title_tag.get_text().replace(' - Travel-China.Help', '').strip()
                 # 清理标题中的特殊字符
-                self.title = re.sub(r'\*\*', '', self.title)  # 移除markdown格式
+                self.title = _RE_MD_STARS.sub('', self.title)  # 移除markdown格式
             
             # 从article-title类中提取标题（更准确）
             article_title = soup.find(class_='article-title')
@@ -108,17 +282,27 @@ class ArticleMetadata:
             if meta_date:
                 date_text = meta_date.get_text()
                 # 尝试提取日期
-                date_match = re.search(r'(\w+ \d{1,2}, \d{4})', date_text)
+                date_match = _RE_DATE.search(date_text)
                 if date_match:
                     self.date = date_match.group(1)
             
             # 提取内容预览（前200个字符）
             content_div = soup.find(class_='article-content')
             if content_div:
-                text = content_div.get_text(strip=True)
-                self.content_preview = text[:200] + '...' if len(text) > 200 else text
+                # 预览只拼接够用的前几段；字数用map逐段统计（循环在C层完成），
+                # 不再把整篇正文拼成一个大字符串
+                strings = list(content_div.stripped_strings)
+                preview_parts = []
+                preview_len = 0
+                for string in strings:
+                    preview_parts.append(string)
+                    preview_len += len(string)
+                    if preview_len > 200:
+                        break
+                word_count = sum(map(len, map(str.split, strings)))
+                preview = ''.join(preview_parts)
+                self.content_preview = preview[:200] + '...' if preview_len > 200 else preview
                 # 估算阅读时间（假设每分钟200字）
-                word_count = len(text.split())
                 self.read_time = f"{max(3, word_count // 200)} min read"
             
             # 提取源URL
@@ -132,26 +316,40 @@ class ArticleMetadata:
             if not self.description:
                 self.description = self.content_preview[:150] + '...' if len(self.content_preview) > 150 else self.content_preview
             
+            self._update_derived()
+            if stat is not None:
+                cache.store(self.file_path, stat, self)
             return True
         except Exception as e:
             print(f"❌ 提取元数据失败 {self.file_path}: {e}")
             return False
     
+    def _update_derived(self):
+        """根据提取到的元数据计算排序用的日期和列表项标签样式（只计算一次）"""
+        self.date_dt = self._parse_date(self.date)
+        self.tag_class = _tag_class_for_title(self.title.lower()) or 'tag-story'
+    
+    @staticmethod
+    def _parse_date(date_text: str) -> datetime:
+        """将 "June 14, 2024" 格式的日期解析为datetime，无法解析时返回datetime.min（排在最后）"""
+        try:
+            return datetime.strptime(date_text, '%B %d, %Y')
+        except ValueError:
+            return datetime.min
+    
     def determine_category(self) -> str:
         """根据标题和内容判断是blog还是guides"""
         title_lower = self.title.lower()
-        desc_lower = self.description.lower()
-        content_lower = self.content_preview.lower()
+        # 标题、描述、内容预览合并后只扫描一次（用换行分隔，关键词不含换行，不会跨字段误匹配）
+        haystack = f"{self.title}\n{self.description}\n{self.content_preview}".lower()
         
         # 检查guides关键词
-        for keyword in GUIDES_KEYWORDS:
-            if keyword in title_lower or keyword in desc_lower or keyword in content_lower:
-                return 'guides'
+        if _RE_GUIDES_KEYWORDS.search(haystack):
+            return 'guides'
         
         # 检查blog关键词
-        for keyword in BLOG_KEYWORDS:
-            if keyword in title_lower or keyword in desc_lower or keyword in content_lower:
-                return 'blog'
+        if _RE_BLOG_KEYWORDS.search(haystack):
+            return 'blog'
         
         # 默认：如果包含"guide"、"how"、"tutorial"等，归为guides
         if any(word in title_lower for word in ['guide', 'how to', 'tutorial', 'tips', 'visa', 'app']):
@@ -162,33 +360,102 @@ class ArticleMetadata:
     
     def get_icon(self) -> str:
         """根据标题内容选择合适的图标"""
-        title_lower = self.title.lower()
-        
-        icon_map = {
-            'visa': '🛂', 'passport': '🛂',
-            'train': '🚄', 'rail': '🚄', 'transport': '🚄',
-            'app': '📱', 'wechat': '📱', 'alipay': '📱',
-            'vpn': '🌐', 'internet': '🌐',
-            'food': '🍜', 'restaurant': '🍜', 'dining': '🍜', 'hotpot': '🌶️',
-            'mountain': '⛰️', 'hiking': '🥾', 'climb': '⛰️',
-            'city': '🏛️', 'beijing': '🏛️', 'shanghai': '🌃', 'chengdu': '🐼',
-            'story': '📖', 'experience': '❤️', 'adventure': '🥾',
-            'funny': '😂', 'humor': '😂',
-            'culture': '🎭', 'cultural': '🎭',
-        }
-        
-        for keyword, icon in icon_map.items():
-            if keyword in title_lower:
-                return icon
-        
-        return '📖'  # 默认图标
+        return _icon_for_title(self.title.lower()) or '📖'  # 默认图标
+
+
+def scan_html_files(directory: Path, skip_index: bool = True) -> List[os.DirEntry]:
+    """列出目录中的HTML文件（scandir自带文件类型，比glob少一次fnmatch和Path构造）
+    
+    Args:
+        directory: 要扫描的目录
+        skip_index: 是否排除index.html
+    """
+    with os.scandir(directory) as entries:
+        return [entry for entry in entries
+                if entry.name.endswith('.html') and entry.is_file()
+                and not (skip_index and entry.name == 'index.html')]
+
+
+# 目录绝对路径 -> 目录中的文件名集合
+_DIR_LISTINGS: Dict[str, set] = {}
+
+
+def _deployed_names(directory: Path) -> set:
+    """目录中的文件名集合（首次使用时scandir扫描一次，之后判断文件是否存在只需查集合）
+    
+    部署写入或删除文件后调用 _track_written / _track_removed 直接更新集合，不必重新扫描
+    """
+    key = os.path.abspath(directory)
+    names = _DIR_LISTINGS.get(key)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            names = set()
+        _DIR_LISTINGS[key] = names
+    return names
+
+
+def _track_written(path: Path):
+    """记录新写入的文件"""
+    names = _DIR_LISTINGS.get(os.path.abspath(path.parent))
+    if names is not None:
+        names.add(path.name)
+
+
+def _track_removed(path: Path):
+    """记录已删除的文件"""
+    names = _DIR_LISTINGS.get(os.path.abspath(path.parent))
+    if names is not None:
+        names.discard(path.name)
+
+
+def _parse_article(entry: os.DirEntry, cache: Optional[MetadataCache] = None) -> Optional[ArticleMetadata]:
+    """提取单篇文章的元数据，失败时返回None"""
+    article = ArticleMetadata(Path(entry.path))
+    stat = entry.stat() if cache is not None else None
+    return article if article.extract_from_html(cache=cache, stat=stat) else None
+
+
+def _parse_article_file(article_file: Path) -> Optional[ArticleMetadata]:
+    """在子进程中提取单篇文章的元数据（参数和返回值都需要可pickle）
+
+    保留读取到的HTML源码随结果一起返回，部署时修复路径直接使用，不必再读一遍文件
+    """
+    article = ArticleMetadata(article_file)
+    return article if article.extract_from_html(keep_html=True) else None
+
+
+def extract_articles_in_processes(article_files: List[Path]) -> List[Optional[ArticleMetadata]]:
+    """用进程池并行提取多篇文章的元数据，结果与article_files一一对应，失败的位置为None"""
+    if len(article_files) <= 1 or PARSE_PROCESSES <= 1:
+        return [_parse_article_file(article_file) for article_file in article_files]
+    with ProcessPoolExecutor(max_workers=min(PARSE_PROCESSES, len(article_files))) as executor:
+        return list(executor.map(_parse_article_file, article_files))
+
+
+def extract_articles(article_files: List[os.DirEntry],
+                     cache: Optional[MetadataCache] = None) -> List[Optional[ArticleMetadata]]:
+    """用线程池并行提取多篇文章的元数据
+    
+    Args:
+        article_files: scan_html_files返回的目录项
+        cache: 元数据缓存
+    
+    返回结果与article_files一一对应（顺序一致），提取失败的位置为None
+    """
+    if not article_files:
+        return []
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+        return list(executor.map(lambda f: _parse_article(f, cache), article_files))
 
 
+@lru_cache(maxsize=4096)
 def safe_filename(title: str) -> str:
     """生成安全的文件名"""
-    # 移除特殊字符
-    filename = re.sub(r'[<>:"/\\|?*]', '', title)
-    filename = re.sub(r'\s+', '_', filename)
+    # 移除特殊字符，并将连续空白替换为下划线
+    filename = _RE_WS.sub('_', title.translate(_FNAME_BAD_TABLE))
     filename = filename.strip('_')
     # 限制长度
     if len(filename) > 100:
@@ -196,9 +463,17 @@ def safe_filename(title: str) -> str:
     return filename or 'article'
 
 
+def parse_article_item(item_html: str):
+    """解析单个文章列表项的HTML片段，返回article-list-item标签
+
+    lxml会给片段自动补全<html><body>，因此需要取出真正的文章项再插入列表
+    """
+    return BeautifulSoup(item_html, PARSER).find(class_='article-list-item')
+
+
 def extract_article_section(html_content: str, section_class: str) -> List[str]:
     """从HTML中提取文章列表部分"""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, PARSER)
     
     # 查找文章列表容器
     article_list = soup.find(class_='article-list')
@@ -212,7 +487,7 @@ def extract_article_section(html_content: str, section_class: str) -> List[str]:
 
 def insert_article_to_list(html_content: str, article_html: str, max_items: int = None) -> str:
     """将新文章插入到文章列表的开头"""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, PARSER)
     
     # 查找文章列表容器
     article_list = soup.find(class_='article-list')
@@ -220,17 +495,13 @@ def insert_article_to_list(html_content: str, article_html: str, max_items: int
         return html_content
     
     # 解析新文章HTML
-    new_article = BeautifulSoup(article_html, 'html.parser')
-    new_item = new_article.find(class_='article-list-item')
+    new_item = parse_article_item(article_html)
     if not new_item:
         return html_content
     
-    # 获取现有文章项
-    existing_items = article_list.find_all(class_='article-list-item', recursive=False)
-    
-    # 移除所有现有项
-    for item in existing_items:
-        item.decompose()
+    # 取下所有现有文章项（extract不销毁节点，之后可直接重新插入）
+    existing_items = [item.extract() for item in
+                      article_list.find_all(class_='article-list-item', recursive=False)]
     
     # 插入新文章到开头
     article_list.insert(0, new_item)
@@ -246,10 +517,20 @@ def insert_article_to_list(html_content: str, article_html: str, max_items: int
     return str(soup)
 
 
-def generate_article_list_item(article: ArticleMetadata, target_dir: str, from_index: str = 'root') -> str:
-    """生成文章列表项的HTML
+def _append_indented(parent, children, indent: str):
+    """按源码缩进把子节点追加到parent中，保持索引页HTML的排版"""
+    for child in children:
+        parent.append('\n' + indent)
+        parent.append(child)
+    parent.append('\n' + indent[:-4])
+
+
+def build_article_tag(soup: BeautifulSoup, article: ArticleMetadata, target_dir: str,
+                      from_index: str = 'root'):
+    """直接构造文章列表项标签（无需先生成HTML字符串再解析）
     
     Args:
+        soup: 目标索引页的文档，用于创建标签
         article: 文章元数据
         target_dir: 目标目录 (blog/guides)
         from_index: 从哪个索引页调用 ('root', 'blog', 'guides')
@@ -264,239 +545,342 @@ def generate_article_list_item(article: ArticleMetadata, target_dir: str, from_i
         # 从blog/index.html或guides/index.html调用，只需要文件名
         relative_path = filename
     
-    # 根据类别选择标签样式
-    tag_class = "tag-story"
-    if 'guide' in article.title.lower() or 'visa' in article.title.lower():
-        tag_class = "tag-guide"
-    elif 'food' in article.title.lower() or 'hotpot' in article.title.lower():
-        tag_class = "tag-food"
-    elif 'adventure' in article.title.lower() or 'hiking' in article.title.lower():
-        tag_class = "tag-adventure"
-    
-    return f'''            <div class="article-list-item" onclick="window.location.href='{relative_path}'">
-                <div class="article-icon">{article.get_icon()}</div>
-                <div class="article-info">
-                    <span class="article-tag {tag_class}">{article.category}</span>
-                    <h3>{article.title}</h3>
-                    <p>{article.description}</p>
-                    <div class="article-meta-compact">
-                        <span>📅 {article.date}</span>
-                        <span>⏱️ {article.read_time}</span>
-                        {f'<span>📍 {article.location}</span>' if article.location else ''}
-                    </div>
-                </div>
-            </div>'''
-
-
-def update_index_html(article: ArticleMetadata, target_dir: str, section_id: str):
-    """更新index.html中的文章列表 - 主页每个栏目最多显示5篇文章"""
-    if not INDEX_HTML.exists():
-        print(f"⚠️  {INDEX_HTML} 不存在，跳过更新")
-        return
-    
-    with open(INDEX_HTML, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    meta = soup.new_tag('div', attrs={'class': 'article-meta-compact'})
+    meta_items = [
+        soup.new_tag('span', string=f"📅 {article.date}"),
+        soup.new_tag('span', string=f"⏱️ {article.read_time}"),
+    ]
+    if article.location:
+        meta_items.append(soup.new_tag('span', string=f"📍 {article.location}"))
+    _append_indented(meta, meta_items, ' ' * 24)
+    
+    info = soup.new_tag('div', attrs={'class': 'article-info'})
+    _append_indented(info, [
+        soup.new_tag('span', attrs={'class': ['article-tag', article.tag_class]}, string=article.category),
+        soup.new_tag('h3', string=article.title),
+        soup.new_tag('p', string=article.description),
+        meta,
+    ], ' ' * 20)
+    
+    item = soup.new_tag('div', attrs={'class': 'article-list-item',
+                                      'onclick': f"window.location.href='{relative_path}'"})
+    _append_indented(item, [
+        soup.new_tag('div', attrs={'class': 'article-icon'}, string=article.get_icon()),
+        info,
+    ], ' ' * 16)
+    return item
+
+
+def generate_article_list_item(article: ArticleMetadata, target_dir: str, from_index: str = 'root') -> str:
+    """生成文章列表项的HTML（供基于字符串的insert_article_to_list使用）"""
+    return str(build_article_tag(BeautifulSoup('', PARSER), article, target_dir, from_index))
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """先写入同目录下的临时文件再替换目标文件，写入中途出错不会留下写了一半的文件"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class DeploymentSession:
+    """部署会话：缓存已解析的索引页，批量部署/删除时每个索引页只解析一次、写入一次
+    
+    用法：
+        with DeploymentSession() as session:
+            deploy_article(file, 'blog', session=session)
+            delete_article('old.html', 'blog', session=session)
+    退出时只写回被修改过的索引页。缓存按文件的mtime校验，未修改的索引页在磁盘上
+    被其他程序改动后会重新解析。
+    """
+    def __init__(self):
+        # 索引页 -> (解析结果, 是否已修改, 解析时文件的mtime_ns)
+        self._soups: Dict[Path, Tuple[BeautifulSoup, bool, int]] = {}
+        # 索引页 -> ({文章链接: 文章项列表}, [(h3标题, 文章项)])，删除文章时按需建立
+        self._item_index: Dict[Path, Tuple[Dict[str, List[Tag]], List[Tuple[str, Tag]]]] = {}
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    def __enter__(self) -> 'DeploymentSession':
+        return self
     
-    # 查找对应的section
-    section = soup.find('section', id=section_id)
-    if not section:
-        print(f"⚠️  未找到section #{section_id}")
-        return
+    def __exit__(self, exc_type, exc_value, tb) -> bool:
+        self.flush()
+        return False
     
-    # 查找文章列表
-    article_list = section.find(class_='article-list')
+    def get_soup(self, index_file: Path) -> Optional[BeautifulSoup]:
+        """获取索引页的解析结果（首次访问或文件有变化时读取并解析），文件不存在时返回None"""
+        cached = self._soups.get(index_file)
+        if cached:
+            if cached[1]:
+                return cached[0]  # 有未写回的修改，以内存中的为准
+            try:
+                if index_file.stat().st_mtime_ns == cached[2]:
+                    return cached[0]
+            except FileNotFoundError:
+                return None
+        
+        # 打开一次文件，mtime取自同一个文件描述符，与读到的内容一致
+        try:
+            with open(index_file, 'rb') as f:
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        soup = BeautifulSoup(data.decode('utf-8'), PARSER)
+        self._soups[index_file] = (soup, False, mtime_ns)
+        self._item_index.pop(index_file, None)
+        return soup
+    
+    def is_loaded(self, index_file: Path) -> bool:
+        """索引页是否已在会话中解析过"""
+        return index_file in self._soups
+    
+    def item_index(self, index_file: Path) -> Tuple[Dict[str, List[Tag]], List[Tuple[str, Tag]]]:
+        """返回索引页中文章项的索引（首次调用时遍历一次文档建立）
+        
+        Returns:
+            (文章链接 -> 文章项列表 的映射, 预先提取的 (h3标题, 文章项) 列表)；
+            调用方移除文章项后需自行从两者中删除对应条目
+        """
+        if index_file not in self._item_index:
+            by_href: Dict[str, List[Tag]] = {}
+            titles: List[Tuple[str, Tag]] = []
+            for item in self.get_soup(index_file).select(_ARTICLE_ITEM_SELECTOR):
+                for href in _article_item_links(item):
+                    by_href.setdefault(href, []).append(item)
+                h3 = item.find('h3')
+                if h3:
+                    titles.append((h3.get_text().strip(), item))
+            self._item_index[index_file] = (by_href, titles)
+        return self._item_index[index_file]
+    
+    def mark_dirty(self, index_file: Path, items_indexed: bool = False):
+        """标记索引页已修改，退出会话时写回
+        
+        Args:
+            items_indexed: 调用方已同步更新了item_index；否则索引失效，下次使用时重建
+        """
+        soup, _, mtime_ns = self._soups[index_file]
+        self._soups[index_file] = (soup, True, mtime_ns)
+        if not items_indexed:
+            self._item_index.pop(index_file, None)
+    
+    def flush(self):
+        """写回所有被修改过的索引页"""
+        for index_file, (soup, dirty, _) in self._soups.items():
+            if not dirty:
+                continue
+            atomic_write_bytes(index_file, soup.encode(formatter='minimal'))
+            self._soups[index_file] = (soup, False, index_file.stat().st_mtime_ns)
+
+
+def _find_article_list(container):
+    """在容器中查找文章列表，找不到时给出提示"""
+    article_list = container.find(class_='article-list')
     if not article_list:
         print(f"⚠️  未找到文章列表")
-        return
+    return article_list
+
+
+def _update_index(soup: BeautifulSoup, locate_list: Callable[[BeautifulSoup], Optional[Tag]],
+                  from_index: str, target_dir: str, article: ArticleMetadata,
+                  max_items: Optional[int] = None) -> bool:
+    """把新文章插入到索引页文章列表的开头
     
-    # 获取现有文章项并保存它们的HTML字符串（在清除之前）
-    existing_items = article_list.find_all(class_='article-list-item', recursive=False)
-    existing_items_html = [str(item) for item in existing_items]
+    Args:
+        soup: 会话中缓存的索引页文档
+        locate_list: 在文档中定位目标文章列表的函数，找不到时返回None
+        from_index: 索引页位置 ('root', 'blog', 'guides')，决定文章链接的相对路径
+        target_dir: 文章所在目录 (blog/guides)
+        article: 文章元数据
+        max_items: 列表最多显示的文章数，None表示不限制（子页面显示所有文章）
     
-    # 生成新文章项（从index.html调用，需要完整路径）
-    article_html = generate_article_list_item(article, target_dir, from_index='root')
+    Returns:
+        是否修改了文档
+    """
+    article_list = locate_list(soup)
+    if not article_list:
+        return False
     
-    # 清除所有内容（包括文章项和文本节点）
+    # 取下现有文章项（extract只是从树中分离，不销毁，之后可直接重新插入）
+    existing_items = [item.extract() for item in
+                      article_list.find_all(class_='article-list-item', recursive=False)]
+    if max_items:
+        existing_items = existing_items[:max_items - 1]
+    
+    # 清除所有内容（包括文章项和文本节点），新文章放在开头，再重新插入现有文章
     article_list.clear()
+    article_list.append(build_article_tag(soup, article, target_dir, from_index))
+    for item in existing_items:
+        article_list.append(item)
+    return True
+
+
+def update_index_html(article: ArticleMetadata, target_dir: str, section_id: str,
+                      session: DeploymentSession):
+    """更新index.html中的文章列表 - 主页每个栏目最多显示5篇文章"""
+    soup = session.get_soup(INDEX_HTML)
+    if soup is None:
+        print(f"⚠️  {INDEX_HTML} 不存在，跳过更新")
+        return
     
-    # 插入新文章到开头
-    new_item = BeautifulSoup(article_html, 'html.parser')
-    article_list.append(new_item)
+    def locate_list(soup):
+        section = soup.find('section', id=section_id)
+        if not section:
+            print(f"⚠️  未找到section #{section_id}")
+            return None
+        return _find_article_list(section)
     
-    # 重新插入现有文章（限制数量：主页最多显示5篇）
     max_items = MAX_HOMEPAGE_STORIES if section_id == 'stories' else MAX_HOMEPAGE_GUIDES
-    for item_html in existing_items_html[:max_items - 1]:
-        existing_item = BeautifulSoup(item_html, 'html.parser')
-        article_list.append(existing_item)
-    
-    # 保存
-    with open(INDEX_HTML, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
-    
-    print(f"✅ 已更新 {INDEX_HTML} 的 {section_id} 部分（显示最新 {max_items} 篇）")
+    if _update_index(soup, locate_list, 'root', target_dir, article, max_items):
+        session.mark_dirty(INDEX_HTML)
+        print(f"✅ 已更新 {INDEX_HTML} 的 {section_id} 部分（显示最新 {max_items} 篇）")
 
 
-def update_blog_index(article: ArticleMetadata):
+def update_blog_index(article: ArticleMetadata, session: DeploymentSession):
     """更新blog/index.html - 子页面必须显示所有文章"""
-    if not BLOG_INDEX.exists():
+    soup = session.get_soup(BLOG_INDEX)
+    if soup is None:
         print(f"⚠️  {BLOG_INDEX} 不存在，跳过更新")
         return
     
-    with open(BLOG_INDEX, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # 查找文章列表
-    article_list = soup.find(class_='article-list')
-    if not article_list:
-        print(f"⚠️  未找到文章列表")
-        return
-    
-    # 获取现有文章项并保存它们的HTML字符串（在清除之前）
-    existing_items = article_list.find_all(class_='article-list-item', recursive=False)
-    existing_items_html = [str(item) for item in existing_items]
-    
-    # 生成新文章项（从blog/index.html调用，只需要文件名）
-    article_html = generate_article_list_item(article, 'blog', from_index='blog')
-    
-    # 清除所有内容（包括文章项和文本节点）
-    article_list.clear()
-    
-    # 插入新文章到开头
-    new_item = BeautifulSoup(article_html, 'html.parser')
-    article_list.append(new_item)
-    
-    # 重新插入所有现有文章（子页面显示所有文章，不限制数量）
-    for item_html in existing_items_html:
-        existing_item = BeautifulSoup(item_html, 'html.parser')
-        article_list.append(existing_item)
-    
-    # 保存
-    with open(BLOG_INDEX, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
-    
-    print(f"✅ 已更新 {BLOG_INDEX}（显示所有文章）")
+    if _update_index(soup, _find_article_list, 'blog', 'blog', article):
+        session.mark_dirty(BLOG_INDEX)
+        print(f"✅ 已更新 {BLOG_INDEX}（显示所有文章）")
 
 
-def update_guides_index(article: ArticleMetadata):
+def update_guides_index(article: ArticleMetadata, session: DeploymentSession):
     """更新guides/index.html - 子页面必须显示所有文章"""
-    if not GUIDES_INDEX.exists():
+    soup = session.get_soup(GUIDES_INDEX)
+    if soup is None:
         print(f"⚠️  {GUIDES_INDEX} 不存在，跳过更新")
         return
     
-    with open(GUIDES_INDEX, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # 根据文章内容判断应该放在哪个section
-    # 这里简化处理，放在第一个合适的section
-    sections = soup.find_all('section')
-    target_section = None
-    
-    title_lower = article.title.lower()
-    if 'visa' in title_lower:
-        target_section = soup.find('section', id='visa')
-    elif any(word in title_lower for word in ['train', 'rail', 'transport', 'metro', 'didi']):
-        target_section = soup.find('section', id='transport')
-    elif any(word in title_lower for word in ['app', 'vpn', 'internet', 'wechat', 'alipay']):
-        target_section = soup.find('section', id='tech')
-    elif any(word in title_lower for word in ['food', 'dining', 'restaurant', 'ordering']):
-        target_section = soup.find('section', id='food')
-    elif any(word in title_lower for word in ['city', 'beijing', 'shanghai', 'chengdu']):
-        target_section = soup.find('section', id='cities')
-    
-    # 如果没找到特定section，使用第一个section
-    if not target_section and sections:
-        target_section = sections[0]
-    
-    if not target_section:
-        print(f"⚠️  未找到合适的section")
-        return
-    
-    # 查找文章列表
-    article_list = target_section.find(class_='article-list')
-    if not article_list:
-        print(f"⚠️  未找到文章列表")
-        return
-    
-    # 获取现有文章项并保存它们的HTML字符串（在清除之前）
-    existing_items = article_list.find_all(class_='article-list-item', recursive=False)
-    existing_items_html = [str(item) for item in existing_items]
-    
-    # 生成新文章项（从guides/index.html调用，只需要文件名）
-    article_html = generate_article_list_item(article, 'guides', from_index='guides')
-    
-    # 清除所有内容（包括文章项和文本节点）
-    article_list.clear()
-    
-    # 插入新文章到开头
-    new_item = BeautifulSoup(article_html, 'html.parser')
-    article_list.append(new_item)
+    def locate_list(soup):
+        # 根据文章标题判断应该放在哪个section，没找到则使用第一个section
+        section_id = _guides_section_for_title(article.title.lower())
+        target_section = soup.find('section', id=section_id) if section_id else None
+        if not target_section:
+            target_section = soup.find('section')
+        if not target_section:
+            print(f"⚠️  未找到合适的section")
+            return None
+        return _find_article_list(target_section)
+    
+    if _update_index(soup, locate_list, 'guides', 'guides', article):
+        session.mark_dirty(GUIDES_INDEX)
+        print(f"✅ 已更新 {GUIDES_INDEX}（显示所有文章）")
+
+
+def _fix_href(href: str) -> str:
+    """返回部署到blog/guides子目录后应使用的链接（blog和guides目录中的文章都需要../返回根目录）"""
+    if not href or href.startswith('http') or href.startswith('#'):
+        return href  # 跳过外部链接和锚点
+    
+    # 修复index.html链接
+    if href == 'index.html' or href.endswith('/index.html'):
+        return '../index.html'
+    # 修复其他相对路径
+    if href.startswith('blog/') or href.startswith('guides/'):
+        return '../' + href
+    return href
+
+
+def _fix_href_attr(m) -> str:
+    """改写一个href属性，保留原来的引号（不带引号的值改写后仍不带引号）"""
+    if m.group(2) is None:
+        return m.group(1) + _fix_href(m.group(4))
+    return f"{m.group(1)}{m.group(2)}{_fix_href(m.group(3))}{m.group(2)}"
+
+
+def _fix_anchor_tag(match) -> str:
+    """修复一个<a>开始标签中的href属性"""
+    return _RE_HREF_ATTR.sub(_fix_href_attr, match.group(0), count=1)
+
+
+def fix_article_paths(html_content: str, html_file: Path, target_dir: str):
+    """修复文章中的相对路径，并将文档写入目标文件
     
-    # 重新插入所有现有文章（子页面显示所有文章，不限制数量）
-    for item_html in existing_items_html:
-        existing_item = BeautifulSoup(item_html, 'html.parser')
-        article_list.append(existing_item)
+    直接用正则改写<a>标签的href属性，源码其余部分原样写出，不需要解析和重新序列化整个文档
     
-    # 保存
-    with open(GUIDES_INDEX, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    Args:
+        html_content: 文章的HTML源码
+        html_file: 目标文件路径
+        target_dir: 目标目录 (blog/guides)
+    """
+    atomic_write_bytes(html_file, _RE_ANCHOR_TAG.sub(_fix_anchor_tag, html_content).encode('utf-8'))
     
-    print(f"✅ 已更新 {GUIDES_INDEX}（显示所有文章）")
+    print(f"✅ 已修复路径: {html_file.name}")
 
 
-def fix_article_paths(html_file: Path, target_dir: str):
-    """修复文章中的相对路径"""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    soup = BeautifulSoup(content, 'html.parser')
-    
-    # 修复导航链接
-    # blog和guides目录中的文章都需要../返回根目录
-    for link in soup.find_all('a', href=True):
-        href = link.get('href', '')
-        if not href or href.startswith('http') or href.startswith('#'):
-            continue  # 跳过外部链接和锚点
-        
-        # 修复index.html链接
-        if href == 'index.html' or href.endswith('/index.html'):
-            link['href'] = '../index.html'
-        # 修复blog/index.html和guides/index.html链接
-        elif href == 'blog/index.html':
-            link['href'] = '../blog/index.html'
-        elif href == 'guides/index.html':
-            link['href'] = '../guides/index.html'
-        # 修复其他相对路径
-        elif href.startswith('blog/') and not href.startswith('../blog/'):
-            link['href'] = '../' + href
-        elif href.startswith('guides/') and not href.startswith('../guides/'):
-            link['href'] = '../' + href
-    
-    # 修复logo链接
-    logo = soup.find(class_='logo')
-    if logo and logo.get('href'):
-        if logo['href'] == 'index.html':
-            logo['href'] = '../index.html'
+def _batch_target(article: Optional[ArticleMetadata], target_dir: str,
+                  auto_detect: bool = False) -> Optional[Tuple[Path, str]]:
+    """批量部署时文章会写入的 (目标目录, 文件名)，目标目录无效或提取失败时返回None"""
+    if not article:
+        return None
+    target_path = {'blog': BLOG_DIR, 'guides': GUIDES_DIR}.get(
+        article.determine_category() if auto_detect else target_dir)
+    if not target_path:
+        return None
+    return target_path, safe_filename(article.title) + '.html'
+
+
+def find_overwrite_conflicts(articles: List[Optional[ArticleMetadata]], target_dir: str,
+                             auto_detect: bool = False) -> List[Path]:
+    """预先找出批量部署中会覆盖已有文件的目标路径
     
-    # 保存
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    Args:
+        articles: 已提取元数据的源文章（提取失败的位置为None）
+    """
+    conflicts = []
+    for article in articles:
+        target = _batch_target(article, target_dir, auto_detect)
+        if target and target[1] in _deployed_names(target[0]) and target[0] / target[1] not in conflicts:
+            conflicts.append(target[0] / target[1])
+    return conflicts
+
+
+def find_duplicate_targets(articles: List[Optional[ArticleMetadata]], target_dir: str,
+                           auto_detect: bool = False) -> Dict[Path, List[int]]:
+    """找出批量部署中标题相同、会写入同一个目标文件的文章
     
-    print(f"✅ 已修复路径: {html_file.name}")
+    Returns:
+        目标文件 -> 这些文章在articles中的下标（只包含对应多篇文章的目标文件）
+    """
+    by_target: Dict[Path, List[int]] = {}
+    for i, article in enumerate(articles):
+        target = _batch_target(article, target_dir, auto_detect)
+        if target:
+            by_target.setdefault(target[0] / target[1], []).append(i)
+    return {target_file: indexes for target_file, indexes in by_target.items() if len(indexes) > 1}
 
 
-def deploy_article(source_file: Path, target_dir: str, auto_detect: bool = False) -> bool:
-    """部署单篇文章"""
+def deploy_article(source_file: Path, target_dir: str, auto_detect: bool = False,
+                   session: Optional[DeploymentSession] = None,
+                   overwrite: Optional[bool] = None,
+                   article: Optional[ArticleMetadata] = None) -> bool:
+    """部署单篇文章
+    
+    Args:
+        session: 部署会话（批量部署时共享，索引页在会话结束时统一写回）；
+                 未指定时为本次部署单独创建一个会话
+        overwrite: 目标文件已存在时是否覆盖；None表示交互式询问
+        article: 已提取好的元数据（批量部署时在进程池中提取）；未指定时在这里提取
+    """
+    if session is None:
+        with DeploymentSession() as session:
+            return deploy_article(source_file, target_dir, auto_detect, session, overwrite, article)
+    
     try:
         # 提取元数据
-        article = ArticleMetadata(source_file)
-        if not article.extract_from_html():
-            return False
+        if article is None:
+            article = ArticleMetadata(source_file)
+            if not article.extract_from_html(keep_html=True):
+                return False
         
         # 自动判断目标目录
         if auto_detect:
@@ -520,36 +904,36 @@ def deploy_article(source_file: Path, target_dir: str, auto_detect: bool = False
         target_filename = safe_filename(article.title) + '.html'
         target_file = target_path / target_filename
         
-        # 如果文件已存在，询问是否覆盖
-        if target_file.exists():
+        # 如果文件已存在，按overwrite决定是否覆盖（未指定时询问）
+        if target_filename in _deployed_names(target_path):
             print(f"⚠️  文件已存在: {target_file}")
-            response = input("是否覆盖? (y/n): ").strip().lower()
-            if response != 'y':
+            if overwrite is None:
+                overwrite = input("是否覆盖? (y/n): ").strip().lower() == 'y'
+            if not overwrite:
                 print("⏭️  跳过此文件")
                 return False
         
-        # 复制文件
-        shutil.copy2(source_file, target_file)
-        print(f"✅ 已复制文件: {target_file}")
-        
-        # 修复文章中的路径
-        fix_article_paths(target_file, target_dir)
+        # 修复文章中的路径并写入目标文件（尽量复用提取元数据时读取的源码）
+        html_content = article.html_content or source_file.read_text(encoding='utf-8')
+        article.html_content = None  # 写出后不再需要，批量部署时尽早释放
+        fix_article_paths(html_content, target_file, target_dir)
+        _track_written(target_file)
+        print(f"✅ 已写入文件: {target_file}")
         
         # 更新索引页
         if target_dir == 'blog':
-            update_blog_index(article)
+            update_blog_index(article, session)
         else:
-            update_guides_index(article)
+            update_guides_index(article, session)
         
         # 更新主页
-        update_index_html(article, target_dir, section_id)
+        update_index_html(article, target_dir, section_id, session)
         
         print(f"✅ 成功部署: {article.title}")
         return True
         
     except Exception as e:
         print(f"❌ 部署失败 {source_file}: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -575,7 +959,7 @@ def rebuild_index(target_dir: str):
         return
     
     # 扫描所有HTML文件（排除index.html）
-    article_files = [f for f in target_path.glob('*.html') if f.name != 'index.html']
+    article_files = scan_html_files(target_path)
     
     if not article_files:
         print(f"⚠️  未找到文章文件: {target_path}")
@@ -585,26 +969,27 @@ def rebuild_index(target_dir: str):
     
     # 提取所有文章的元数据
     articles = []
-    for article_file in article_files:
-        article = ArticleMetadata(article_file)
-        if article.extract_from_html():
+    cache = MetadataCache()
+    for article_file, article in zip(article_files, extract_articles(article_files, cache)):
+        if article:
             articles.append(article)
             print(f"  ✓ {article.title}")
         else:
             print(f"  ✗ 跳过 {article_file.name}（无法提取元数据）")
     
+    cache.save()
+    
     if not articles:
         print("❌ 没有有效的文章可以添加到索引")
         return
     
-    # 按日期排序（最新的在前）
-    articles.sort(key=lambda x: x.date, reverse=True)
+    # 按日期排序（最新的在前，使用提取时已解析好的datetime）
+    articles.sort(key=lambda x: x.date_dt, reverse=True)
     
     # 读取索引文件
-    with open(index_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    html_content = index_file.read_text(encoding='utf-8')
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, PARSER)
     
     if target_dir == 'blog':
         # blog/index.html 只有一个 article-list
@@ -613,11 +998,9 @@ def rebuild_index(target_dir: str):
             # 清除所有内容（包括文章项和文本节点）
             article_list.clear()
             
-            # 添加所有文章
-            for article in articles:
-                article_html = generate_article_list_item(article, 'blog', from_index='blog')
-                article_item = BeautifulSoup(article_html, 'html.parser')
-                article_list.append(article_item)
+            # 添加所有文章（一次性插入）
+            article_list.extend([build_article_tag(soup, article, 'blog', from_index='blog')
+                                 for article in articles])
             
             print(f"✅ 已重建 {index_file}，包含 {len(articles)} 篇文章")
     else:
@@ -625,41 +1008,45 @@ def rebuild_index(target_dir: str):
         # 这里简化处理：将所有文章添加到第一个合适的 section
         sections = soup.find_all('section')
         if sections:
-            # 为每篇文章找到合适的 section
+            # 预先建立 id -> section 的映射（同id取第一个，与find一致），路由时只查字典
+            section_by_id = {}
+            for section in sections:
+                if section.get('id'):
+                    section_by_id.setdefault(section['id'], section)
+            
+            # 每个 section 的 article-list、已有标题及待插入的文章项（标题集合随插入更新，避免重复扫描列表）
+            pending: Dict[int, Optional[Tuple[Tag, set, list]]] = {}
+            
+            # 为每篇文章找到合适的 section，没找到则使用第一个 section
             for article in articles:
-                title_lower = article.title.lower()
-                target_section = None
-                
-                if 'visa' in title_lower:
-                    target_section = soup.find('section', id='visa')
-                elif any(word in title_lower for word in ['train', 'rail', 'transport', 'metro', 'didi']):
-                    target_section = soup.find('section', id='transport')
-                elif any(word in title_lower for word in ['app', 'vpn', 'internet', 'wechat', 'alipay']):
-                    target_section = soup.find('section', id='tech')
-                elif any(word in title_lower for word in ['food', 'dining', 'restaurant', 'ordering']):
-                    target_section = soup.find('section', id='food')
-                elif any(word in title_lower for word in ['city', 'beijing', 'shanghai', 'chengdu']):
-                    target_section = soup.find('section', id='cities')
+                section_id = _guides_section_for_title(article.title.lower())
+                target_section = section_by_id.get(section_id) or sections[0]
                 
-                if not target_section and sections:
-                    target_section = sections[0]
-                
-                if target_section:
+                if id(target_section) not in pending:
                     article_list = target_section.find(class_='article-list')
                     if article_list:
-                        # 检查是否已存在（避免重复）
-                        existing_titles = [item.find('h3').get_text() if item.find('h3') else '' 
-                                          for item in article_list.find_all(class_='article-list-item', recursive=False)]
-                        if article.title not in existing_titles:
-                            article_html = generate_article_list_item(article, 'guides', from_index='guides')
-                            article_item = BeautifulSoup(article_html, 'html.parser')
-                            article_list.append(article_item)
+                        existing_titles = {item.find('h3').get_text() if item.find('h3') else ''
+                                           for item in article_list.find_all(class_='article-list-item', recursive=False)}
+                        pending[id(target_section)] = (article_list, existing_titles, [])
+                    else:
+                        pending[id(target_section)] = None
+                if not pending[id(target_section)]:
+                    continue
+                _, existing_titles, new_items = pending[id(target_section)]
+                
+                # 检查是否已存在（避免重复）
+                if article.title not in existing_titles:
+                    existing_titles.add(article.title)
+                    new_items.append(build_article_tag(soup, article, 'guides', from_index='guides'))
+            
+            # 每个列表一次性插入新文章项
+            for article_list, _, new_items in filter(None, pending.values()):
+                article_list.extend(new_items)
             
             print(f"✅ 已重建 {index_file}，包含 {len(articles)} 篇文章")
     
     # 保存
-    with open(index_file, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    atomic_write_bytes(index_file, soup.encode(formatter='minimal'))
 
 
 def rebuild_homepage():
@@ -670,35 +1057,32 @@ def rebuild_homepage():
     
     print("🔄 开始重建主页面索引...")
     
+    cache = MetadataCache()
+    
     # 扫描 blog 目录的文章
     blog_articles = []
     if BLOG_DIR.exists():
-        blog_files = [f for f in BLOG_DIR.glob('*.html') if f.name != 'index.html']
+        blog_files = scan_html_files(BLOG_DIR)
         print(f"\n📁 扫描 blog 目录，找到 {len(blog_files)} 篇文章")
-        for article_file in blog_files:
-            article = ArticleMetadata(article_file)
-            if article.extract_from_html():
-                blog_articles.append(article)
+        blog_articles = [article for article in extract_articles(blog_files, cache) if article]
     
     # 扫描 guides 目录的文章
     guides_articles = []
     if GUIDES_DIR.exists():
-        guides_files = [f for f in GUIDES_DIR.glob('*.html') if f.name != 'index.html']
+        guides_files = scan_html_files(GUIDES_DIR)
         print(f"📁 扫描 guides 目录，找到 {len(guides_files)} 篇文章")
-        for article_file in guides_files:
-            article = ArticleMetadata(article_file)
-            if article.extract_from_html():
-                guides_articles.append(article)
+        guides_articles = [article for article in extract_articles(guides_files, cache) if article]
+    
+    cache.save()
     
-    # 按日期排序（最新的在前）
-    blog_articles.sort(key=lambda x: x.date, reverse=True)
-    guides_articles.sort(key=lambda x: x.date, reverse=True)
+    # 按日期排序（最新的在前，使用提取时已解析好的datetime）
+    blog_articles.sort(key=lambda x: x.date_dt, reverse=True)
+    guides_articles.sort(key=lambda x: x.date_dt, reverse=True)
     
     # 读取主页面
-    with open(INDEX_HTML, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    html_content = INDEX_HTML.read_text(encoding='utf-8')
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, PARSER)
     
     # 更新 stories section
     stories_section = soup.find('section', id='stories')
@@ -709,10 +1093,8 @@ def rebuild_homepage():
             article_list.clear()
             
             # 添加最新的5篇 blog 文章
-            for article in blog_articles[:MAX_HOMEPAGE_STORIES]:
-                article_html = generate_article_list_item(article, 'blog', from_index='root')
-                article_item = BeautifulSoup(article_html, 'html.parser')
-                article_list.append(article_item)
+            article_list.extend([build_article_tag(soup, article, 'blog', from_index='root')
+                                 for article in blog_articles[:MAX_HOMEPAGE_STORIES]])
             
             print(f"✅ 已更新 stories section，显示 {min(len(blog_articles), MAX_HOMEPAGE_STORIES)} 篇文章")
     
@@ -725,278 +1107,675 @@ def rebuild_homepage():
             article_list.clear()
             
             # 添加最新的5篇 guides 文章
-            for article in guides_articles[:MAX_HOMEPAGE_GUIDES]:
-                article_html = generate_article_list_item(article, 'guides', from_index='root')
-                article_item = BeautifulSoup(article_html, 'html.parser')
-                article_list.append(article_item)
+            article_list.extend([build_article_tag(soup, article, 'guides', from_index='root')
+                                 for article in guides_articles[:MAX_HOMEPAGE_GUIDES]])
             
             print(f"✅ 已更新 guides section，显示 {min(len(guides_articles), MAX_HOMEPAGE_GUIDES)} 篇文章")
     
     # 保存
-    with open(INDEX_HTML, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    atomic_write_bytes(INDEX_HTML, soup.encode(formatter='minimal'))
     
     print(f"\n✅ 已重建主页面索引")
 
 
-def deploy_all(source_dir: Path, target_dir: str = None, auto_detect: bool = False):
-    """部署所有文章"""
+def deploy_all(source_dir: Path, target_dir: str = None, auto_detect: bool = False,
+               overwrite: str = 'ask'):
+    """部署所有文章
+    
+    Args:
+        overwrite: 目标文件已存在时的处理方式 ('ask': 部署前统一询问一次, 'yes': 覆盖, 'no': 跳过)
+    """
     if not source_dir.exists():
         print(f"❌ 源目录不存在: {source_dir}")
         return
     
     # 查找所有HTML文件
-    html_files = list(source_dir.glob('*.html'))
-    if not html_files:
+    entries = scan_html_files(source_dir, skip_index=False)
+    if not entries:
         print(f"⚠️  未找到HTML文件: {source_dir}")
         return
     
-    print(f"📁 找到 {len(html_files)} 个HTML文件")
+    print(f"📁 找到 {len(entries)} 个HTML文件")
+    
+    # 在进程池中并行提取所有文章的元数据，主进程只负责写文件和修改索引页
+    source_files = [Path(entry.path) for entry in entries]
+    articles = extract_articles_in_processes(source_files)
+    
+    # 本批中同名的文章会写入同一个文件，只部署第一篇，其余的明确报告并跳过
+    duplicates = find_duplicate_targets(articles, target_dir or 'blog', auto_detect)
+    if duplicates:
+        print(f"⚠️  以下 {len(duplicates)} 个目标文件对应本批中多篇同名文章，只部署第一篇:")
+        for target_file, indexes in duplicates.items():
+            print(f"   - {target_file}: {', '.join(source_files[i].name for i in indexes)}")
+    duplicate_indexes = {i for indexes in duplicates.values() for i in indexes[1:]}
+    
+    # 先找出所有会覆盖的文件，只询问一次，部署过程中不再等待输入
+    overwrite_files = overwrite == 'yes'
+    if overwrite == 'ask':
+        conflicts = find_overwrite_conflicts(articles, target_dir or 'blog', auto_detect)
+        if conflicts:
+            print(f"⚠️  以下 {len(conflicts)} 个文件已存在:")
+            for conflict in conflicts:
+                print(f"   - {conflict}")
+            overwrite_files = input("是否全部覆盖? (y/n): ").strip().lower() == 'y'
     
     success_count = 0
-    for html_file in html_files:
-        print(f"\n📄 处理: {html_file.name}")
-        if deploy_article(html_file, target_dir or 'blog', auto_detect):
-            success_count += 1
+    with DeploymentSession() as session:
+        for i, (source_file, article) in enumerate(zip(source_files, articles)):
+            print(f"\n📄 处理: {source_file.name}")
+            if article is None:
+                continue  # 提取元数据失败（原因已在提取时打印）
+            if i in duplicate_indexes:
+                print("⏭️  与本批中前面的文章同名，跳过此文件")
+                continue
+            if deploy_article(source_file, target_dir or 'blog', auto_detect, session,
+                              overwrite=overwrite_files, article=article):
+                success_count += 1
     
     print(f"\n{'='*50}")
-    print(f"✅ 成功部署: {success_count}/{len(html_files)}")
+    print(f"✅ 成功部署: {success_count}/{len(entries)}")
     print(f"{'='*50}")
 
 
-def remove_article_from_index(index_file: Path, article_filename: str, article_title: str = None):
+def _css_string(value: str) -> str:
+    """把值转成CSS选择器中的字符串字面量"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _add_items_with_title(container, article_title: str, matched: List[Tag]):
+    """把h3标题与article_title相同或包含它的文章项追加到matched中（已匹配的不重复添加）"""
+    matched_ids = {id(item) for item in matched}
+    for item in container.select(_ARTICLE_ITEM_SELECTOR):
+        if id(item) in matched_ids:
+            continue
+        h3 = item.find('h3')
+        if h3 and article_title in h3.get_text().strip():
+            matched.append(item)
+
+
+def _select_article_items(container, href_part: str, article_title: str = None) -> List[Tag]:
+    """用CSS选择器找出容器内要移除的文章项
+    
+    文章项的onclick或内部链接包含href_part即匹配；提供了标题时，
+    h3标题与之相同或包含它的文章项也匹配。
+    """
+    href = _css_string(href_part)
+    matched = container.select(f'{_ARTICLE_ITEM_SELECTOR}[onclick*={href}], '
+                               f'{_ARTICLE_ITEM_SELECTOR}:has(a[href*={href}])')
+    
+    # 如果提供了标题，也通过标题匹配（精确匹配或包含匹配）
+    if article_title:
+        _add_items_with_title(container, article_title, matched)
+    return matched
+
+
+def _xpath_has_class(class_name: str) -> str:
+    """XPath条件：class属性中包含指定的类名"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+if etree is not None:
+    # 预编译删除文章时用到的XPath
+    # 所有文章列表中直接位于列表下的文章项
+    _XPATH_ARTICLE_ITEMS = etree.XPath(f'.//*[{_xpath_has_class("article-list")}]'
+                                       f'/*[{_xpath_has_class("article-list-item")}]')
+    _XPATH_SECTION_BY_ID = etree.XPath('//section[@id=$id]')
+    _XPATH_ITEM_HREFS = etree.XPath('.//a/@href')
+    _XPATH_ITEM_TITLE = etree.XPath('string((.//h3)[1])')
+
+# 没有lxml时，先只解析文章列表（或主页的指定section）检查是否有要删除的文章，
+# 有匹配时才解析整个页面（class用正则匹配，以支持多个类名）
+_ARTICLE_LIST_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)article-list(?:\s|$)'))
+
+
+def _lxml_select_article_items(container, href_part: str, article_title: str = None) -> list:
+    """lxml版的_select_article_items：找出容器内要移除的文章项"""
+    item_hrefs, item_title = _XPATH_ITEM_HREFS, _XPATH_ITEM_TITLE
+    matched = []
+    for item in _XPATH_ARTICLE_ITEMS(container):
+        if (href_part in item.get('onclick', '')
+                or any(href_part in href for href in item_hrefs(item))
+                or (article_title and article_title in item_title(item).strip())):
+            matched.append(item)
+    return matched
+
+
+# 直接在源码中删除文章项：文章项开始标签、div/section标签、onclick/href属性、第一个h3
+_RE_ARTICLE_ITEM_START = re.compile(
+    r'<div\b[^>]*\bclass\s*=\s*(["\'])(?:[^"\']*\s)?article-list-item(?:\s[^"\']*)?\1[^>]*>', re.IGNORECASE)
+_RE_DIV_TAG = re.compile(r'<(/?)div\b[^>]*>', re.IGNORECASE)
+_RE_SECTION_TAG = re.compile(r'<(/?)section\b[^>]*>', re.IGNORECASE)
+_RE_ONCLICK_ATTR = re.compile(r'(?<![\w-])onclick\s*=\s*(["\'])(.*?)\1', re.IGNORECASE | re.DOTALL)
+_RE_ANY_HREF_ATTR = re.compile(r'(?<![\w-])href\s*=\s*(["\'])(.*?)\1', re.IGNORECASE | re.DOTALL)
+_RE_FIRST_H3 = re.compile(r'<h3\b[^>]*>(.*?)</h3>', re.IGNORECASE | re.DOTALL)
+_RE_ANY_TAG = re.compile(r'<[^>]+>')
+
+
+@lru_cache(maxsize=None)
+def _section_start_re(section_id: str):
+    """指定id的<section>开始标签的正则（按id编译一次）"""
+    return re.compile(r'<section\b[^>]*\bid\s*=\s*(["\'])' + re.escape(section_id) + r'\1[^>]*>',
+                      re.IGNORECASE)
+
+
+def _find_closing_tag(html_content: str, tag_re, pos: int) -> int:
+    """从pos（开始标签之后）向后找到配对的结束标签，返回结束标签末尾的位置，找不到返回-1"""
+    depth = 1
+    for m in tag_re.finditer(html_content, pos):
+        depth += -1 if m.group(1) else 1
+        if depth == 0:
+            return m.end()
+    return -1
+
+
+def _article_item_matches(start_tag: str, item_html: str, href_part: str, article_title: str = None) -> bool:
+    """源码层面的文章项匹配，规则与_select_article_items相同"""
+    onclick = _RE_ONCLICK_ATTR.search(start_tag)
+    if onclick and href_part in unescape(onclick.group(2)):
+        return True
+    if any(href_part in unescape(m.group(2)) for m in _RE_ANY_HREF_ATTR.finditer(item_html, len(start_tag))):
+        return True
+    if article_title:
+        h3 = _RE_FIRST_H3.search(item_html)
+        if h3 and article_title in unescape(_RE_ANY_TAG.sub('', h3.group(1))).strip():
+            return True
+    return False
+
+
+def _splice_article_items(html_content: str, targets: List[Tuple[str, Optional[str]]],
+                          section_id: str = None) -> Optional[Tuple[str, set]]:
+    """不解析DOM，顺序扫描一遍源码，切掉匹配任一目标的文章项
+    
+    Args:
+        html_content: 索引页源码
+        targets: [(href_part, article_title), ...]，批量删除时一次扫描处理所有文章
+        section_id: 只在该id的section内查找（主页使用）
+    
+    Returns:
+        (删除后的源码, 匹配到的targets下标集合)；页面结构无法识别时返回None（由调用方回退到DOM解析）
+    """
+    begin, end = 0, len(html_content)
+    if section_id:
+        section = _section_start_re(section_id).search(html_content)
+        if not section:
+            return None
+        begin = section.end()
+        end = _find_closing_tag(html_content, _RE_SECTION_TAG, begin)
+        if end < 0:
+            return None
+    
+    spans = []
+    matched = set()
+    pos = begin
+    while True:
+        start = _RE_ARTICLE_ITEM_START.search(html_content, pos, end)
+        if not start:
+            break
+        close = _find_closing_tag(html_content, _RE_DIV_TAG, start.end())
+        if close < 0 or close > end:
+            return None
+        item_html = html_content[start.start():close]
+        hits = [i for i, (href_part, article_title) in enumerate(targets)
+                if _article_item_matches(start.group(0), item_html, href_part, article_title)]
+        if hits:
+            spans.append((start.start(), close))
+            matched.update(hits)
+        pos = close
+    
+    if not spans:
+        return html_content, matched
+    
+    # 只切掉文章项本身，前后的空白文本保留（与decompose一致）
+    parts = []
+    last = 0
+    for span_start, span_end in spans:
+        parts.append(html_content[last:span_start])
+        last = span_end
+    parts.append(html_content[last:])
+    return ''.join(parts), matched
+
+
+def _may_reference(data: bytes, href_part: str, article_title: str = None) -> bool:
+    """字节层面的快速检查：源码中既没有文章链接也没有文章标题时，不可能有匹配的文章项，不必解析页面
+    
+    链接和标题在源码中可能被转义（&amp;等），转义前后的写法都检查
+    """
+    needles = [href_part, article_title] if article_title else [href_part]
+    return any(form.encode('utf-8') in data
+               for needle in needles
+               for form in {needle, escape(needle), escape(needle, quote=False)})
+
+
+def _remove_article_items(index_file: Path, href_part: str, article_title: str = None,
+                          section_id: str = None) -> bool:
+    """从索引页中移除匹配的文章项，有改动时写回文件
+    
+    Args:
+        index_file: 索引文件路径
+        href_part: 文章链接中应包含的路径
+        article_title: 文章标题（可选，用于标题匹配）
+        section_id: 只在该id的section内查找（主页使用）
+    
+    Returns:
+        是否移除了文章
+    """
+    data = index_file.read_bytes()
+    if not _may_reference(data, href_part, article_title):
+        return False
+    html_content = data.decode('utf-8')
+    
+    # 常见情况：直接在源码中切掉文章项，只有找不到匹配时才解析整个页面确认
+    spliced = _splice_article_items(html_content, [(href_part, article_title)], section_id)
+    if spliced is not None and spliced[1]:
+        atomic_write_bytes(index_file, spliced[0].encode('utf-8'))
+        return True
+    
+    if lxml_html is not None:
+        # lxml在C层完成解析和序列化；显式指定utf-8，不依赖页面的charset声明
+        doc = lxml_html.document_fromstring(data, parser=lxml_html.HTMLParser(encoding='utf-8'))
+        container = doc
+        if section_id:
+            sections = _XPATH_SECTION_BY_ID(doc, id=section_id)
+            if not sections:
+                return False
+            container = sections[0]
+        
+        items = _lxml_select_article_items(container, href_part, article_title)
+        for item in items:
+            item.drop_tree()  # 与decompose一样保留文章项之后的文本（缩进空白）
+        if items:
+            atomic_write_bytes(index_file, lxml_html.tostring(doc.getroottree(), encoding='utf-8'))
+        return bool(items)
+    
+    strainer = SoupStrainer('section', id=section_id) if section_id else _ARTICLE_LIST_STRAINER
+    if not _select_article_items(BeautifulSoup(html_content, PARSER, parse_only=strainer),
+                                 href_part, article_title):
+        return False
+    
+    soup = BeautifulSoup(html_content, PARSER)
+    container = soup
+    if section_id:
+        container = soup.find('section', id=section_id)
+        if not container:
+            return False
+    
+    items = _select_article_items(container, href_part, article_title)
+    for item in items:
+        item.decompose()
+    if items:
+        atomic_write_bytes(index_file, soup.encode(formatter='minimal'))
+    return bool(items)
+
+
+_RE_ONCLICK_HREF = re.compile(r"location\.href\s*=\s*(['\"])(.*?)\1")
+
+
+def _article_item_links(item: Tag) -> List[str]:
+    """文章项指向的链接：onclick中跳转的地址以及内部<a>的href"""
+    links = [m.group(2) for m in _RE_ONCLICK_HREF.finditer(item.get('onclick', ''))]
+    links.extend(a['href'] for a in item.find_all('a', href=True))
+    return links
+
+
+def _remove_article_items_in_session(session: DeploymentSession, index_file: Path, href_part: str,
+                                     article_title: str = None, section_id: str = None) -> bool:
+    """在会话缓存的索引页中移除匹配的文章项，由会话统一写回
+    
+    按链接查找先用会话中的 链接 -> 文章项 映射精确查找；没有完全一致的链接时
+    （如写成./、../或带查询参数），退回与源码扫描/DOM路径相同的包含匹配。
+    按标题查找只比较预先提取好的标题，批量删除时不必每次遍历所有文章项。
+    """
+    if not session.is_loaded(index_file):
+        # 尚未解析过的索引页先做字节层面的快速检查，页面中没有这篇文章时不必解析
+        try:
+            if not _may_reference(index_file.read_bytes(), href_part, article_title):
+                return False
+        except FileNotFoundError:
+            return False
+    soup = session.get_soup(index_file)
+    if soup is None:
+        return False
+    container = soup.find('section', id=section_id) if section_id else soup
+    if not container:
+        return False
+    
+    by_href, titles = session.item_index(index_file)
+    items = by_href.get(href_part) or [item for href, href_items in by_href.items()
+                                       if href_part in href for item in href_items]
+    # 同一文章项的onclick和<a>可能指向同一链接，去重后再移除
+    items = list({id(item): item for item in items}.values())
+    
+    # 如果提供了标题，也通过标题匹配（精确匹配或包含匹配）
+    if article_title:
+        matched_ids = {id(item) for item in items}
+        items.extend(item for title, item in titles
+                     if article_title in title and id(item) not in matched_ids)
+    
+    if section_id:
+        items = [item for item in items if item.find_parent('section') is container]
+    
+    removed_ids = {id(item) for item in items}
+    for item in items:
+        for href in _article_item_links(item):
+            by_href[href] = [other for other in by_href.get(href, []) if id(other) not in removed_ids]
+        item.decompose()
+    if items:
+        titles[:] = [(title, item) for title, item in titles if id(item) not in removed_ids]
+        session.mark_dirty(index_file, items_indexed=True)
+    return bool(items)
+
+
+def remove_article_from_index(index_file: Path, article_filename: str, article_title: str = None,
+                              session: Optional[DeploymentSession] = None):
     """从索引页中移除指定文章
     
     Args:
         index_file: 索引文件路径
         article_filename: 文章文件名（用于匹配链接）
         article_title: 文章标题（可选，用于更精确匹配）
+        session: 部署会话（批量删除时共享，索引页只解析一次，会话结束时统一写回）；
+                 未指定时直接修改文件
     """
     if not index_file.exists():
         return False
     
     try:
-        with open(index_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        removed = False
-        
-        # 查找所有文章列表（可能多个section）
-        article_lists = soup.find_all(class_='article-list')
-        
-        for article_list in article_lists:
-            items = article_list.find_all(class_='article-list-item', recursive=False)
-            for item in items:
-                # 检查onclick属性（文章项使用onclick跳转）
-                onclick = item.get('onclick', '') if hasattr(item, 'get') else ''
-                
-                # 匹配文件名（onclick格式: window.location.href='filename.html' 或 'filename.html'）
-                if article_filename in onclick:
-                    item.decompose()
-                    removed = True
-                    continue
-                
-                # 检查内部链接
-                link = item.find('a')
-                if link:
-                    href = link.get('href', '')
-                    if article_filename in href:
-                        item.decompose()
-                        removed = True
-                        continue
-                
-                # 如果提供了标题，也通过标题匹配
-                if article_title:
-                    h3 = item.find('h3')
-                    if h3:
-                        item_title = h3.get_text().strip()
-                        # 精确匹配或包含匹配
-                        if article_title == item_title or article_title in item_title:
-                            item.decompose()
-                            removed = True
-                            continue
-        
-        if removed:
-            with open(index_file, 'w', encoding='utf-8') as f:
-                f.write(str(soup))
-            return True
-        
-        return False
+        # 所有文章列表（可能多个section）中匹配的文章项
+        # onclick格式: window.location.href='filename.html'
+        if session is not None:
+            return _remove_article_items_in_session(session, index_file, article_filename, article_title)
+        return _remove_article_items(index_file, article_filename, article_title)
     except Exception as e:
         print(f"⚠️  从 {index_file} 移除文章时出错: {e}")
         return False
 
 
-def remove_article_from_homepage(article_filename: str, target_dir: str, article_title: str = None):
+def remove_article_from_homepage(article_filename: str, target_dir: str, article_title: str = None,
+                                 session: Optional[DeploymentSession] = None):
     """从主页中移除指定文章"""
     if not INDEX_HTML.exists():
         return False
     
     try:
-        with open(INDEX_HTML, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        removed = False
-        
-        # 确定要检查的section
+        # 确定要检查的section，主页使用完整路径 blog/filename.html 或 guides/filename.html
         section_id = 'stories' if target_dir == 'blog' else 'guides'
-        section = soup.find('section', id=section_id)
-        
-        if section:
-            article_list = section.find(class_='article-list')
-            if article_list:
-                items = article_list.find_all(class_='article-list-item', recursive=False)
-                for item in items:
-                    # 检查onclick属性（主页使用完整路径 blog/filename.html 或 guides/filename.html）
-                    onclick = item.get('onclick', '') if hasattr(item, 'get') else ''
-                    
-                    # 匹配完整路径
-                    full_path = f"{target_dir}/{article_filename}"
-                    if full_path in onclick:
-                        item.decompose()
-                        removed = True
-                        continue
-                    
-                    # 检查内部链接
-                    link = item.find('a')
-                    if link:
-                        href = link.get('href', '')
-                        if full_path in href:
-                            item.decompose()
-                            removed = True
-                            continue
-                    
-                    # 如果提供了标题，也通过标题匹配
-                    if article_title:
-                        h3 = item.find('h3')
-                        if h3:
-                            item_title = h3.get_text().strip()
-                            # 精确匹配或包含匹配
-                            if article_title == item_title or article_title in item_title:
-                                item.decompose()
-                                removed = True
-                                continue
-        
-        if removed:
-            with open(INDEX_HTML, 'w', encoding='utf-8') as f:
-                f.write(str(soup))
-            return True
-        
-        return False
+        full_path = f"{target_dir}/{article_filename}"
+        if session is not None:
+            return _remove_article_items_in_session(session, INDEX_HTML, full_path, article_title,
+                                                    section_id=section_id)
+        return _remove_article_items(INDEX_HTML, full_path, article_title, section_id=section_id)
     except Exception as e:
         print(f"⚠️  从主页移除文章时出错: {e}")
         return False
 
 
-def delete_article(article_path: str, target_dir: str = None) -> bool:
-    """删除已部署的文章
+_RE_TITLE_TAG = re.compile(r'<title\b[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_RE_ARTICLE_TITLE_TAG = re.compile(
+    r'<(\w+)\b[^>]*\bclass\s*=\s*(["\'])(?:[^"\']*\s)?article-title(?:\s[^"\']*)?\2[^>]*>(.*?)</\1\s*>',
+    re.IGNORECASE | re.DOTALL)
+
+
+def read_article_title(article_file: Path) -> Optional[str]:
+    """只用正则读取文章标题（与ArticleMetadata的规则相同：article-title优先，其次<title>）
     
-    Args:
-        article_path: 文章文件路径（可以是完整路径或文件名）
-        target_dir: 目标目录（blog/guides），如果未指定则自动检测
+    删除文章时只需要标题用于匹配索引项，不必解析整个文档
     """
-    try:
-        # 解析文件路径
-        article_file = Path(article_path)
-        
-        # 如果路径是相对路径且不包含目录，尝试在blog和guides中查找
-        if not article_file.is_absolute() and '/' not in article_path and '\\' not in article_path:
-            if target_dir:
-                # 如果指定了目标目录，在该目录中查找
-                if target_dir == 'blog':
-                    article_file = BLOG_DIR / article_path
-                elif target_dir == 'guides':
-                    article_file = GUIDES_DIR / article_path
-                else:
-                    print(f"❌ 无效的目标目录: {target_dir}")
-                    return False
+    html_content = article_file.read_text(encoding='utf-8', errors='replace')
+    match = _RE_ARTICLE_TITLE_TAG.search(html_content)
+    if match:
+        title = unescape(_RE_ANY_TAG.sub('', match.group(3))).strip()
+    else:
+        match = _RE_TITLE_TAG.search(html_content)
+        if not match:
+            return None
+        title = unescape(match.group(1)).replace(' - Travel-China.Help', '').strip()
+        title = _RE_MD_STARS.sub('', title)  # 移除markdown格式
+    return title or None
+
+
+def _resolve_article_file(article_path: str, target_dir: str = None) -> Optional[Tuple[Path, str]]:
+    """解析要删除的文章路径，返回 (文章文件, 目标目录)，找不到时打印原因并返回None"""
+    article_file = Path(article_path)
+    
+    # 如果路径是相对路径且不包含目录，尝试在blog和guides中查找
+    if not article_file.is_absolute() and '/' not in article_path and '\\' not in article_path:
+        if target_dir:
+            # 如果指定了目标目录，在该目录中查找
+            if target_dir == 'blog':
+                article_file = BLOG_DIR / article_path
+            elif target_dir == 'guides':
+                article_file = GUIDES_DIR / article_path
             else:
-                # 自动检测：先在blog中查找，再在guides中查找
-                blog_file = BLOG_DIR / article_path
-                guides_file = GUIDES_DIR / article_path
-                
-                if blog_file.exists() and guides_file.exists():
-                    print(f"⚠️  在blog和guides目录中都找到了文件: {article_path}")
-                    print("请使用 --target 参数指定目录，或使用完整路径")
-                    return False
-                elif blog_file.exists():
-                    article_file = blog_file
-                    target_dir = 'blog'
-                elif guides_file.exists():
-                    article_file = guides_file
-                    target_dir = 'guides'
-                else:
-                    print(f"❌ 未找到文件: {article_path}")
-                    print(f"   在 {BLOG_DIR} 和 {GUIDES_DIR} 中都没有找到")
-                    return False
+                print(f"❌ 无效的目标目录: {target_dir}")
+                return None
         else:
-            # 完整路径，确定目标目录
-            article_file = Path(article_path)
-            if not article_file.exists():
-                print(f"❌ 文件不存在: {article_file}")
-                return False
+            # 自动检测：先在blog中查找，再在guides中查找
+            in_blog = article_path in _deployed_names(BLOG_DIR)
+            in_guides = article_path in _deployed_names(GUIDES_DIR)
             
-            # 从路径判断目标目录
-            if not target_dir:
-                if 'blog' in str(article_file):
-                    target_dir = 'blog'
-                elif 'guides' in str(article_file):
-                    target_dir = 'guides'
-                else:
-                    print(f"⚠️  无法从路径判断目标目录，请使用 --target 参数")
-                    return False
-        
-        # 确认文件存在
+            if in_blog and in_guides:
+                print(f"⚠️  在blog和guides目录中都找到了文件: {article_path}")
+                print("请使用 --target 参数指定目录，或使用完整路径")
+                return None
+            elif in_blog:
+                article_file = BLOG_DIR / article_path
+                target_dir = 'blog'
+            elif in_guides:
+                article_file = GUIDES_DIR / article_path
+                target_dir = 'guides'
+            else:
+                print(f"❌ 未找到文件: {article_path}")
+                print(f"   在 {BLOG_DIR} 和 {GUIDES_DIR} 中都没有找到")
+                return None
+    else:
+        # 完整路径，确定目标目录
         if not article_file.exists():
             print(f"❌ 文件不存在: {article_file}")
-            return False
-        
-        # 提取文章信息（用于从索引中移除）
-        article = ArticleMetadata(article_file)
-        article.extract_from_html()  # 尝试提取，失败也不影响删除
-        
-        article_filename = article_file.name
-        article_title = article.title if article.title else None
-        
-        # 确认删除
-        print(f"📄 准备删除文章: {article_file}")
-        if article_title:
-            print(f"   标题: {article_title}")
-        print(f"   目录: {target_dir}")
-        
-        response = input("确认删除? (y/n): ").strip().lower()
-        if response != 'y':
-            print("⏭️  取消删除")
-            return False
-        
-        # 从索引页中移除
-        if target_dir == 'blog':
-            if remove_article_from_index(BLOG_INDEX, article_filename, article_title):
-                print(f"✅ 已从 {BLOG_INDEX} 中移除")
-        else:
-            if remove_article_from_index(GUIDES_INDEX, article_filename, article_title):
-                print(f"✅ 已从 {GUIDES_INDEX} 中移除")
-        
-        # 从主页中移除
-        if remove_article_from_homepage(article_filename, target_dir, article_title):
-            print(f"✅ 已从主页中移除")
+            return None
         
-        # 删除文件
+        # 从路径判断目标目录
+        if not target_dir:
+            if 'blog' in str(article_file):
+                target_dir = 'blog'
+            elif 'guides' in str(article_file):
+                target_dir = 'guides'
+            else:
+                print(f"⚠️  无法从路径判断目标目录，请使用 --target 参数")
+                return None
+    
+    # 确认文件存在
+    if article_file.name not in _deployed_names(article_file.parent):
+        print(f"❌ 文件不存在: {article_file}")
+        return None
+    
+    return article_file, target_dir
+
+
+def _remove_article_from_indexes(article_file: Path, target_dir: str, article_title: Optional[str],
+                                 session: Optional[DeploymentSession] = None):
+    """从所在目录的索引页和主页中移除文章"""
+    article_filename = article_file.name
+    index_file = BLOG_INDEX if target_dir == 'blog' else GUIDES_INDEX
+    if remove_article_from_index(index_file, article_filename, article_title, session):
+        print(f"✅ 已从 {index_file} 中移除")
+    
+    if remove_article_from_homepage(article_filename, target_dir, article_title, session):
+        print(f"✅ 已从主页中移除")
+
+
+def _read_title_for_delete(article_file: Path) -> Optional[str]:
+    """读取文章标题（用于从索引中移除），读取失败也不影响删除"""
+    try:
+        return read_article_title(article_file)
+    except OSError:
+        return None
+
+
+def delete_article(article_path: str, target_dir: str = None,
+                   session: Optional[DeploymentSession] = None) -> bool:
+    """删除已部署的文章
+    
+    Args:
+        article_path: 文章文件路径（可以是完整路径或文件名）
+        target_dir: 目标目录（blog/guides），如果未指定则自动检测
+        session: 部署会话（批量删除时共享，索引页在会话结束时统一写回）；
+                 未指定时直接修改索引文件
+    
+    只处理预期中的文件读写错误，其他异常直接抛出；命令行使用 delete_article_safe。
+    """
+    resolved = _resolve_article_file(article_path, target_dir)
+    if not resolved:
+        return False
+    article_file, target_dir = resolved
+    
+    article_title = _read_title_for_delete(article_file)
+    
+    # 确认删除
+    print(f"📄 准备删除文章: {article_file}")
+    if article_title:
+        print(f"   标题: {article_title}")
+    print(f"   目录: {target_dir}")
+    
+    response = input("确认删除? (y/n): ").strip().lower()
+    if response != 'y':
+        print("⏭️  取消删除")
+        return False
+    
+    # 从索引页和主页中移除（出错时只打印警告，不影响删除文件）
+    _remove_article_from_indexes(article_file, target_dir, article_title, session)
+    
+    # 删除文件
+    try:
         article_file.unlink()
-        print(f"✅ 已删除文件: {article_file}")
-        
-        print(f"✅ 成功删除文章: {article_title or article_filename}")
-        return True
-        
+    except OSError as e:
+        print(f"❌ 删除文件失败 {article_file}: {e}")
+        return False
+    _track_removed(article_file)
+    print(f"✅ 已删除文件: {article_file}")
+    
+    print(f"✅ 成功删除文章: {article_title or article_file.name}")
+    return True
+
+
+def delete_article_safe(article_path: str, target_dir: str = None) -> bool:
+    """命令行入口：删除文章，出现任何异常时打印错误和堆栈并返回False"""
+    try:
+        return delete_article(article_path, target_dir)
     except Exception as e:
         print(f"❌ 删除失败: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+def _splice_index_batch(index_file: Path, targets_by_section: Dict[Optional[str], List[Tuple[str, Optional[str]]]]
+                        ) -> Dict[Optional[str], List[Tuple[str, Optional[str]]]]:
+    """批量删除时用一次源码扫描移除所有文章项，不构建DOM
+    
+    每个section只扫描一遍源码，有改动时写回一次。
+    
+    Returns:
+        源码扫描中没有匹配的目标（按section分组），由调用方用DOM解析确认
+    """
+    leftovers = {}
+    if not index_file.exists():
+        return leftovers
+    
+    html_content = index_file.read_bytes().decode('utf-8')
+    changed = 0
+    for section_id, targets in targets_by_section.items():
+        spliced = _splice_article_items(html_content, targets, section_id)
+        if spliced is None:
+            leftovers[section_id] = targets
+            continue
+        html_content, matched = spliced
+        changed += len(matched)
+        missing = [target for i, target in enumerate(targets) if i not in matched]
+        if missing:
+            leftovers[section_id] = missing
+    
+    if changed:
+        atomic_write_bytes(index_file, html_content.encode('utf-8'))
+        if index_file == INDEX_HTML:
+            print(f"✅ 已从主页中移除 {changed} 篇文章")
+        else:
+            print(f"✅ 已从 {index_file} 中移除 {changed} 篇文章")
+    return leftovers
+
+
+def delete_articles(article_paths: List[str], target_dir: str = None) -> int:
+    """批量删除已部署的文章，只确认一次
+    
+    所有索引页在一个会话中修改，每个索引页只解析一次、写回一次；
+    索引页写回后再删除文章文件。
+    
+    Returns:
+        成功删除的文章数
+    """
+    # 先解析所有路径和标题
+    targets = []
+    for article_path in article_paths:
+        resolved = _resolve_article_file(article_path, target_dir)
+        if resolved:
+            article_file, article_dir = resolved
+            targets.append((article_file, article_dir, _read_title_for_delete(article_file)))
+    
+    if not targets:
+        return 0
+    
+    # 确认删除
+    print(f"📄 准备删除 {len(targets)} 篇文章:")
+    for article_file, article_dir, article_title in targets:
+        print(f"   - [{article_dir}] {article_title or article_file.name} ({article_file})")
+    
+    response = input("确认删除? (y/n): ").strip().lower()
+    if response != 'y':
+        print("⏭️  取消删除")
+        return 0
+    
+    # 从索引页和主页中移除：先对每个索引页做一次源码扫描批量切掉文章项，
+    # 源码扫描找不到的文章再在会话中解析DOM确认（会话结束时统一写回）
+    batches = {BLOG_INDEX: {None: []}, GUIDES_INDEX: {None: []}, INDEX_HTML: {'stories': [], 'guides': []}}
+    for article_file, article_dir, article_title in targets:
+        index_file = BLOG_INDEX if article_dir == 'blog' else GUIDES_INDEX
+        section_id = 'stories' if article_dir == 'blog' else 'guides'
+        batches[index_file][None].append((article_file.name, article_title))
+        batches[INDEX_HTML][section_id].append((f"{article_dir}/{article_file.name}", article_title))
+    
+    with DeploymentSession() as session:
+        for index_file, targets_by_section in batches.items():
+            targets_by_section = {section_id: section_targets
+                                  for section_id, section_targets in targets_by_section.items() if section_targets}
+            try:
+                leftovers = _splice_index_batch(index_file, targets_by_section)
+            except Exception as e:
+                print(f"⚠️  从 {index_file} 移除文章时出错: {e}")
+                continue
+            for section_id, section_targets in leftovers.items():
+                for href_part, article_title in section_targets:
+                    try:
+                        if _remove_article_items_in_session(session, index_file, href_part, article_title,
+                                                            section_id=section_id):
+                            print(f"✅ 已从主页中移除" if section_id else f"✅ 已从 {index_file} 中移除")
+                    except Exception as e:
+                        print(f"⚠️  从 {index_file} 移除文章时出错: {e}")
+    
+    # 删除文件
+    deleted = 0
+    for article_file, _, article_title in targets:
+        try:
+            article_file.unlink()
+            deleted += 1
+            _track_removed(article_file)
+            print(f"✅ 已删除文件: {article_file}")
+        except OSError as e:
+            print(f"❌ 删除文件失败 {article_file}: {e}")
+    
+    print(f"\n{'='*50}")
+    print(f"✅ 成功删除: {deleted}/{len(targets)}")
+    print(f"{'='*50}")
+    return deleted
+
+
 def main():
     parser = argparse.ArgumentParser(description='自动部署翻译后的文章')
     parser.add_argument('--source-dir', '-s', 
@@ -1014,7 +1793,12 @@ def main():
                        choices=['blog', 'guides', 'homepage'],
                        help='从文件系统重建索引（blog、guides或homepage）')
     parser.add_argument('--delete', '-d',
-                       help='删除已部署的文章（指定文件路径或文件名）')
+                       nargs='+',
+                       help='删除已部署的文章（指定文件路径或文件名，可指定多个）')
+    parser.add_argument('--overwrite', '-o',
+                       choices=['ask', 'yes', 'no'],
+                       default='ask',
+                       help='目标文件已存在时：ask 询问（批量部署时只询问一次）、yes 覆盖、no 跳过')
     
     args = parser.parse_args()
     
@@ -1022,7 +1806,10 @@ def main():
     
     # 如果指定了删除
     if args.delete:
-        delete_article(args.delete, args.target)
+        if len(args.delete) == 1:
+            delete_article_safe(args.delete[0], args.target)
+        else:
+            delete_articles(args.delete, args.target)
         return
     
     # 如果指定了重建索引
@@ -1042,13 +1829,14 @@ def main():
         
         target_dir = args.target or 'blog'
         auto_detect = args.auto
-        deploy_article(source_file, target_dir, auto_detect)
+        overwrite = {'ask': None, 'yes': True, 'no': False}[args.overwrite]
+        deploy_article(source_file, target_dir, auto_detect, overwrite=overwrite)
     else:
         # 部署整个目录
         if args.auto:
-            deploy_all(source_dir, auto_detect=True)
+            deploy_all(source_dir, auto_detect=True, overwrite=args.overwrite)
         elif args.target:
-            deploy_all(source_dir, target_dir=args.target)
+            deploy_all(source_dir, target_dir=args.target, overwrite=args.overwrite)
         else:
             print("❌ 请指定 --target (blog/guides) 或使用 --auto 自动判断")
             sys.exit(1)
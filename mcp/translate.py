@@ -24,8 +24,11 @@ Config file example (config.yaml):
   deepl_api_key: YOUR_KEY
   openai_api_key: YOUR_KEY
   max_concurrency: 6
+  translate_concurrency: 4  # optional, defaults to max_concurrency
+  translate_rpm: 500  # optional, max translation requests per minute
   timeout: 30
   use_cache: true
+  respect_robots: false  # optional, skip URLs disallowed by robots.txt
 """
 
 import os
@@ -37,14 +40,24 @@ import hashlib
 import argparse
 import time
 import json
+import string
 import logging
 import random
 import warnings
-from urllib.parse import urljoin, urlparse
+import copy
+import gzip
+import multiprocessing
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from html import escape as html_escape
+from urllib.parse import urljoin, urlparse, quote
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, List
+from bs4 import BeautifulSoup, NavigableString, CData
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
+from functools import cached_property
 from urllib.robotparser import RobotFileParser
 
 # Suppress SSL warnings (common with self-signed certificates in corporate environments)
@@ -63,6 +76,58 @@ try:
 except:
     yaml = None
 
+try:
+    import orjson
+except:
+    orjson = None
+
+try:
+    import aiofiles
+except:
+    aiofiles = None
+
+try:
+    from aiolimiter import AsyncLimiter
+except:
+    AsyncLimiter = None
+
+try:
+    import py3langid
+except:
+    py3langid = None
+
+try:
+    import blake3
+except:
+    blake3 = None
+
+try:
+    import xxhash
+except:
+    xxhash = None
+
+try:
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except:
+    HAS_LXML = False
+
+# BeautifulSoup parser: lxml (C) when available, otherwise the stdlib html.parser
+BS_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except:
+    HAS_SELECTOLAX = False
+
+try:
+    from resiliparse.extract.html2text import extract_plain_text
+    from resiliparse.parse.html import HTMLTree
+    HAS_RESILIPARSE = True
+except:
+    HAS_RESILIPARSE = False
+
 try:
     from trafilatura import extract, fetch_url
     HAS_TRAFILATURA = True
@@ -112,15 +177,29 @@ except ImportError:
 # Simple fallback translator using basic HTTP requests
 class SimpleTranslator:
     """Simple translator using public APIs without complex dependencies"""
-    def __init__(self, source_lang='auto', target_lang='en', service='lingva'):
+    def __init__(self, session: aiohttp.ClientSession, source_lang='auto', target_lang='en', service='lingva'):
+        self.session = session  # 共享的 aiohttp 会话，复用 keep-alive 连接
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.service = service
     
-    def translate(self, text: str) -> str:
+    # Back-off when a 429 carries no usable Retry-After header
+    DEFAULT_RETRY_AFTER = 30
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None):
+        """GET a JSON endpoint (certificate checks off, as before); None unless the status is 200"""
+        async with self.session.get(url, params=params, ssl=False,
+                                    timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status == 429:
+                retry_after = response.headers.get('Retry-After', '')
+                raise RateLimitedError(self.service, float(retry_after) if retry_after.isdigit()
+                                       else self.DEFAULT_RETRY_AFTER)
+            if response.status != 200:
+                return None
+            return _json_loads(await response.read())
+    
+    async def translate(self, text: str) -> str:
         """Use different public translation services"""
-        import requests
-        
         # Expanded language map
         lang_map = {
             'zh': 'zh', 'zh-CN': 'zh', 'zh-TW': 'zh',
@@ -137,10 +216,10 @@ class SimpleTranslator:
         
         if self.service == 'lingva':
             # Lingva Translate - free Google Translate proxy
-            url = f"https://lingva.ml/api/v1/{source}/{target}/{requests.utils.quote(text)}"
-            response = requests.get(url, timeout=30, verify=False)
-            if response.status_code == 200:
-                return response.json()['translation']
+            url = f"https://lingva.ml/api/v1/{source}/{target}/{quote(text)}"
+            data = await self._get_json(url)
+            if data is not None:
+                return data['translation']
         
         elif self.service == 'mymemory':
             # MyMemory Translation API
@@ -150,9 +229,8 @@ class SimpleTranslator:
                 'q': text[:500],  # Limit length
                 'langpair': langpair
             }
-            response = requests.get(url, params=params, timeout=30, verify=False)
-            if response.status_code == 200:
-                data = response.json()
+            data = await self._get_json(url, params)
+            if data is not None:
                 if data.get('responseData'):
                     return data['responseData']['translatedText']
         
@@ -165,9 +243,9 @@ class SimpleTranslator:
                 'text': text,
                 'engine': 'google'
             }
-            response = requests.get(url, params=params, timeout=30, verify=False)
-            if response.status_code == 200:
-                return response.json()['translated_text']
+            data = await self._get_json(url, params)
+            if data is not None:
+                return data['translated_text']
         
         raise Exception(f"Translation failed with service: {self.service}")
 
@@ -195,6 +273,13 @@ class VerificationPageError(RuntimeError):
     pass
 
 
+class RateLimitedError(RuntimeError):
+    """翻译服务返回429，retry_after秒内不要再请求它"""
+    def __init__(self, service: str, retry_after: float):
+        super().__init__(f"{service} rate limited, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
 # ----------------------------- Config -----------------------------
 @dataclass
 class Config:
@@ -213,12 +298,32 @@ class Config:
     browser_headless: bool = True  # NEW: 浏览器无头模式
     browser_wait_time: int = 3  # NEW: 等待JavaScript渲染的时间（秒）
     max_concurrency: int = 6
+    translate_concurrency: Optional[int] = None  # NEW: Max in-flight translation requests (defaults to max_concurrency)
+    translate_rpm: Optional[int] = None  # NEW: Max translation requests per minute (token bucket, None = unlimited)
     timeout: int = 30
     chunk_size: int = 3000  # Chunk size for splitting long text
     use_cache: bool = True
+    respect_robots: bool = False  # NEW: Skip URLs disallowed by the site's robots.txt
     max_retries: int = 3
     user_agent: str = "ArticleTranslator/2.0 (+https://github.com/yourrepo)"
 
+    # Values that are fixed for the whole run, computed once instead of per article
+    @cached_property
+    def source_lang_display(self) -> str:
+        return LANG_NAMES.get(self.source_lang, self.source_lang)
+
+    @cached_property
+    def target_lang_display(self) -> str:
+        return LANG_NAMES.get(self.target_lang, self.target_lang)
+
+    @cached_property
+    def fetched_date(self) -> str:
+        return time.strftime('%B %d, %Y', time.localtime())
+
+    @cached_property
+    def out_dir(self) -> Path:
+        return Path(self.output_dir)
+
     @classmethod
     def from_yaml(cls, path: str):
         if not yaml:
@@ -279,18 +384,85 @@ class Config:
             browser_headless=getattr(args, 'browser_headless', True),
             browser_wait_time=getattr(args, 'browser_wait', 3),
             max_concurrency=args.concurrency,
+            translate_concurrency=args.translate_concurrency,
+            translate_rpm=args.translate_rpm,
             timeout=args.timeout,
-            use_cache=args.cache
+            use_cache=args.cache,
+            respect_robots=getattr(args, 'robots', False)
         )
 
 
 # ----------------------------- Utilities -----------------------------
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes (orjson when available)"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+async def write_text_async(path: Path, text: str):
+    """Write a text file without blocking the event loop (one write via aiofiles, or in a worker thread)"""
+    data = text.encode('utf-8')
+    if aiofiles:
+        async with aiofiles.open(path, 'wb') as f:
+            await f.write(data)
+    else:
+        await asyncio.to_thread(path.write_bytes, data)
+
+
+class TokenBucket:
+    """Minimal asyncio token bucket allowing max_rate acquisitions per time_period (fallback for aiolimiter)"""
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.max_rate, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+_UNSAFE_FN_RE = re.compile(r'[<>:"/\\|?*]')
+
+
 def safe_filename(s: str) -> str:
-    s = re.sub(r'[<>:"/\\|?*]', '', s)
+    s = _UNSAFE_FN_RE.sub('', s)
     s = s.strip().replace(' ', '_')
     return s[:120] or hashlib.sha1(s.encode()).hexdigest()[:10]
 
 
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+
+def _decode_body(raw: bytes, charset: Optional[str]) -> str:
+    """Decode a page body once: header charset, else <meta charset> in the first 4 KB, else utf-8"""
+    encoding = charset
+    if not encoding:
+        m = _META_CHARSET_RE.search(raw, 0, 4096)
+        encoding = m.group(1).decode('ascii') if m else 'utf-8'
+    # 声明 gb2312/gbk 的中文页面经常混有超出字符集的字，用超集 gb18030 解码
+    if encoding.lower() in ('gb2312', 'gbk'):
+        encoding = 'gb18030'
+    try:
+        return raw.decode(encoding, errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
+
+
 class RetrySession:
     def __init__(self, session: aiohttp.ClientSession, config: Config):
         self.session = session
@@ -311,21 +483,22 @@ class RetrySession:
                         **kwargs
                     ) as resp:
                         resp.raise_for_status()
-                        return await resp.text()
+                        return _decode_body(await resp.read(), resp.charset)
             except Exception as e:
                 if attempt == self.config.max_retries - 1:
-                    logger.error(f"Failed to fetch {url} after {self.config.max_retries} attempts: {e}")
+                    logger.error("Failed to fetch %s after %s attempts: %s", url, self.config.max_retries, e)
                     raise
                 wait = 2 ** attempt
-                logger.warning(f"Retry {attempt + 1}/{self.config.max_retries} for {url} after {wait}s")
+                logger.warning("Retry %s/%s for %s after %ss", attempt + 1, self.config.max_retries, url, wait)
                 await asyncio.sleep(wait)
 
 class EnhancedRetrySession:
     """Enhanced session with anti-scraping features"""
-    def __init__(self, session: aiohttp.ClientSession, config: Config):
+    def __init__(self, session: aiohttp.ClientSession, config: Config, cache: Optional['DiskCache'] = None):
         self.session = session
         self.config = config
         self.sem = asyncio.Semaphore(config.max_concurrency)
+        self.cache = cache  # 已抓取页面的缓存（只缓存通过验证的内容）
 
     def _get_headers(self, url: str) -> Dict[str, str]:
         """Generate headers with anti-scraping features"""
@@ -371,10 +544,16 @@ class EnhancedRetrySession:
 
     async def get(self, url: str, **kwargs) -> str:
         """Enhanced get with retry and anti-scraping"""
+        if self.cache:
+            cached = await self.cache.get(url)
+            if cached is not None:
+                logger.info("✓ Using cached page: %s", url)
+                return cached
+        
         # 如果配置了使用浏览器自动化，直接使用浏览器
         if getattr(self.config, 'use_browser', False) and HAS_BROWSER_FETCHER:
             try:
-                logger.info(f"🌐 使用浏览器自动化抓取: {url}")
+                logger.info("🌐 使用浏览器自动化抓取: %s", url)
                 content = await fetch_with_browser(
                     url,
                     browser_type=getattr(self.config, 'browser_type', 'playwright'),
@@ -383,12 +562,14 @@ class EnhancedRetrySession:
                     proxy=self.config.proxy,
                     wait_time=getattr(self.config, 'browser_wait_time', 3)
                 )
-                logger.info(f"✓ 浏览器自动化成功获取内容 ({len(content)} 字符)")
+                logger.info("✓ 浏览器自动化成功获取内容 (%s 字符)", len(content))
+                if self.cache:
+                    await self.cache.set(url, content)
                 return content
             except RuntimeError as e:
                 # 浏览器初始化失败，提供详细错误信息
                 error_msg = str(e)
-                logger.error(f"❌ 浏览器自动化失败: {error_msg}")
+                logger.error("❌ 浏览器自动化失败: %s", error_msg)
                 
                 # 如果是SPA页面，提供替代方案
                 if 'ctrip.com' in url or 'mafengwo.cn' in url:
@@ -397,7 +578,7 @@ class EnhancedRetrySession:
                     logger.warning("  1. 尝试桌面版URL（更容易抓取）")
                     if 'm.ctrip.com' in url:
                         desktop_url = url.replace('m.ctrip.com', 'www.ctrip.com')
-                        logger.warning(f"     桌面版: {desktop_url}")
+                        logger.warning("     桌面版: %s", desktop_url)
                     logger.warning("  2. 手动安装ChromeDriver: bash mcp/install_chromedriver.sh")
                     logger.warning("  3. 或暂时不使用浏览器自动化")
                     logger.warning("")
@@ -405,7 +586,7 @@ class EnhancedRetrySession:
                 logger.warning("⚠️  回退到普通HTTP请求（可能无法获取SPA页面内容）...")
                 # 继续使用普通HTTP请求（虽然可能失败，但至少尝试）
             except Exception as e:
-                logger.error(f"❌ 浏览器自动化失败: {e}")
+                logger.error("❌ 浏览器自动化失败: %s", e)
                 logger.warning("⚠️  回退到普通HTTP请求...")
                 # 继续使用普通HTTP请求
         
@@ -441,21 +622,21 @@ class EnhancedRetrySession:
                     ) as resp:
                         # Handle different status codes
                         if resp.status == 403:
-                            logger.warning(f"403 Forbidden for {url}, rotating User-Agent...")
+                            logger.warning("403 Forbidden for %s, rotating User-Agent...", url)
                             headers['User-Agent'] = random.choice(USER_AGENTS)
                             if attempt == self.config.max_retries - 1:
                                 raise RuntimeError(f"403 Forbidden after {self.config.max_retries} attempts")
                             continue
                         elif resp.status == 429:
                             wait = 2 ** (attempt + 2)
-                            logger.warning(f"429 Rate limited, waiting {wait}s...")
+                            logger.warning("429 Rate limited, waiting %ss...", wait)
                             await asyncio.sleep(wait)
                             if attempt == self.config.max_retries - 1:
                                 raise RuntimeError(f"Rate limited after {self.config.max_retries} attempts")
                             continue
                         
                         resp.raise_for_status()
-                        content = await resp.text()
+                        content = _decode_body(await resp.read(), resp.charset)
                         
                         # 改进内容验证：对于马蜂窝等网站，需要检测验证页面
                         # 检查是否是验证页面或空内容
@@ -496,7 +677,7 @@ class EnhancedRetrySession:
                                         f"  2. 使用浏览器自动化工具（Selenium/Playwright）\n"
                                         f"  3. 手动访问页面并复制内容到文件"
                                     )
-                                logger.error(f"❌ {error_msg}")
+                                logger.error("❌ %s", error_msg)
                                 raise VerificationPageError(error_msg)
                             
                             # 检测验证关键词
@@ -510,7 +691,7 @@ class EnhancedRetrySession:
                                     body_content = content.split('<body')[1].split('</body>')[0] if '</body>' in content else ''
                                     if len(body_content.strip()) < 50:  # body内容很少
                                         is_blocked = True
-                                        logger.warning(f"⚠️  Detected suspicious short content with empty body")
+                                        logger.warning("⚠️  Detected suspicious short content with empty body")
                         else:
                             # 其他网站的检测
                             if len(content) < 500:
@@ -521,7 +702,7 @@ class EnhancedRetrySession:
                         if is_blocked:
                             # probe.js已经在上面检测并抛出异常了，这里不会执行到
                             suspicious_count += 1
-                            logger.warning(f"Suspicious content detected for {url} (attempt {attempt + 1}, suspicious count: {suspicious_count})")
+                            logger.warning("Suspicious content detected for %s (attempt %s, suspicious count: %s)", url, attempt + 1, suspicious_count)
                             
                             # 如果多次检测到可疑内容，尝试更长的等待时间
                             wait_time = 3 + (suspicious_count * 2)
@@ -529,7 +710,7 @@ class EnhancedRetrySession:
                             
                             # 如果是最后一次尝试，仍然返回内容（让extractor处理）
                             if attempt == self.config.max_retries - 1:
-                                logger.warning(f"⚠️  Reached max retries, returning content anyway (may be blocked page)")
+                                logger.warning("⚠️  Reached max retries, returning content anyway (may be blocked page)")
                                 if not content or len(content) < 100:
                                     raise RuntimeError(
                                         f"内容太短或为空（{len(content) if content else 0}字符），可能是验证页面。\n"
@@ -542,11 +723,13 @@ class EnhancedRetrySession:
                         if not content:
                             raise RuntimeError("Received empty content")
                         
+                        if self.cache:
+                            await self.cache.set(url, content)
                         return content
                         
             except asyncio.TimeoutError:
                 last_error = f"Timeout after {self.config.timeout}s"
-                logger.warning(f"Timeout for {url} (attempt {attempt + 1}/{self.config.max_retries})")
+                logger.warning("Timeout for %s (attempt %s/%s)", url, attempt + 1, self.config.max_retries)
                 if attempt == self.config.max_retries - 1:
                     raise RuntimeError(f"Timeout after {self.config.max_retries} attempts: {last_error}")
             except aiohttp.ClientProxyConnectionError as e:
@@ -566,10 +749,10 @@ class EnhancedRetrySession:
                 
                 if attempt == 0:
                     # 第一次失败，尝试不使用代理
-                    logger.warning(f"⚠️  代理连接失败，尝试不使用代理继续...")
-                    logger.warning(f"   错误: {last_error}")
+                    logger.warning("⚠️  代理连接失败，尝试不使用代理继续...")
+                    logger.warning("   错误: %s", last_error)
                     if proxy_info:
-                        logger.warning(f"   {proxy_info}")
+                        logger.warning("   %s", proxy_info)
                     # 标记代理失败，下次重试时不使用代理
                     proxy_failed = True
                     continue
@@ -583,37 +766,75 @@ class EnhancedRetrySession:
                         f"  3. 防火墙是否阻止了连接{proxy_info}\n"
                         f"  4. 如果不需要代理，可以在config.yaml中移除proxy配置"
                     )
-                    logger.error(f"❌ 代理连接失败: {error_msg}")
+                    logger.error("❌ 代理连接失败: %s", error_msg)
                     if attempt == self.config.max_retries - 1:
                         raise RuntimeError(f"代理连接失败: {error_msg}\n原始错误: {last_error}")
             except aiohttp.ClientError as e:
                 last_error = str(e)
-                logger.warning(f"Client error for {url}: {e} (attempt {attempt + 1}/{self.config.max_retries})")
+                logger.warning("Client error for %s: %s (attempt %s/%s)", url, e, attempt + 1, self.config.max_retries)
                 if attempt == self.config.max_retries - 1:
                     raise RuntimeError(f"Client error after {self.config.max_retries} attempts: {last_error}")
             except VerificationPageError as e:
                 # 验证页面错误，不应该重试，直接抛出
-                logger.error(f"❌ {e}")
+                logger.error("❌ %s", e)
                 raise  # 直接抛出，不重试
             except RuntimeError as e:
                 last_error = str(e)
-                logger.error(f"Runtime error for {url}: {e}")
+                logger.error("Runtime error for %s: %s", url, e)
                 if attempt == self.config.max_retries - 1:
                     raise
             except Exception as e:
                 last_error = str(e)
-                logger.error(f"Unexpected error for {url}: {e}")
+                logger.error("Unexpected error for %s: %s", url, e)
                 if attempt == self.config.max_retries - 1:
                     raise
             
             wait = 2 ** attempt
-            logger.warning(f"Retry {attempt + 1}/{self.config.max_retries} for {url} after {wait}s")
+            logger.warning("Retry %s/%s for %s after %ss", attempt + 1, self.config.max_retries, url, wait)
             await asyncio.sleep(wait)
         
         # 如果所有重试都失败，抛出异常（确保不会返回None）
         raise RuntimeError(f"Failed to fetch {url} after {self.config.max_retries} attempts. Last error: {last_error}")
 
 
+class RobotsCache:
+    """robots.txt policies fetched once per host on the shared session (concurrent lookups share the fetch)"""
+    def __init__(self, session: aiohttp.ClientSession, config: Config):
+        self.session = session
+        self.config = config
+        self._policies: Dict[str, asyncio.Future] = {}
+
+    async def allowed(self, url: str) -> bool:
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        if origin not in self._policies:
+            self._policies[origin] = asyncio.ensure_future(self._fetch(origin))
+        rp = await self._policies[origin]
+        return rp.can_fetch(self.config.user_agent or '*', url)
+
+    async def _fetch(self, origin: str) -> RobotFileParser:
+        # Same rules as RobotFileParser.read(): 401/403 disallow everything, other errors allow everything
+        rp = RobotFileParser(origin + '/robots.txt')
+        try:
+            async with self.session.get(
+                origin + '/robots.txt',
+                headers={'User-Agent': self.config.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                ssl=False,
+                proxy=self.config.proxy,
+            ) as resp:
+                if resp.status in (401, 403):
+                    rp.disallow_all = True
+                elif resp.status >= 400:
+                    rp.allow_all = True
+                else:
+                    rp.parse(_decode_body(await resp.read(), resp.charset).splitlines())
+        except Exception as e:
+            logger.debug("robots.txt unavailable for %s: %s", origin, e)
+            rp.allow_all = True
+        return rp
+
+
 # ----------------------------- Article Extraction -----------------------------
 class ArticleExtractor:
     def __init__(self, config: Config):
@@ -621,23 +842,29 @@ class ArticleExtractor:
     
     def _clean_html_keep_formatting(self, soup: BeautifulSoup, url: str, max_images: int = 2) -> BeautifulSoup:
         """Clean HTML while preserving formatting and keeping up to max_images images"""
-        # Remove unwanted tags that don't affect content structure
-        for tag in soup(['script', 'style', 'noscript', 'iframe', 'nav', 'footer', 'header', 'aside']):
-            tag.decompose()
+        # One traversal collects both the unwanted tags and the images; tags nested in an already removed
+        # one (and images inside removed tags) are marked decomposed and skipped
+        images = []
+        for tag in soup(['script', 'style', 'noscript', 'iframe', 'nav', 'footer', 'header', 'aside', 'img']):
+            if tag.name == 'img':
+                images.append(tag)
+            elif not tag.decomposed:
+                # Remove unwanted tags that don't affect content structure
+                tag.decompose()
         
         # Handle images: keep up to max_images
-        images = soup.find_all('img')
+        images = [img for img in images if not img.decomposed]
         if len(images) > max_images:
             # Keep first max_images images, remove the rest
             for img in images[max_images:]:
                 img.decompose()
-            logger.debug(f"保留 {max_images} 张图片，移除了 {len(images) - max_images} 张")
+            logger.debug("保留 %s 张图片，移除了 %s 张", max_images, len(images) - max_images)
         elif len(images) > 0:
-            logger.debug(f"保留 {len(images)} 张图片")
+            logger.debug("保留 %s 张图片", len(images))
         
         # Ensure image URLs are absolute
         base_url = urlparse(url)
-        for img in soup.find_all('img'):
+        for img in images[:max_images]:
             src = img.get('src') or img.get('data-src') or img.get('data-original')
             if src:
                 # Convert relative URLs to absolute
@@ -654,43 +881,159 @@ class ArticleExtractor:
         return soup
 
     def extract(self, html: str, url: str) -> Dict:
-        """Try multiple extraction strategies in order of quality"""
+        """Try multiple extraction strategies in order of quality
         
-        # Strategy 1: trafilatura (best)
+        The page is parsed at most once into a BeautifulSoup tree, which is shared by
+        the trafilatura and bs4 strategies (and _get_title). With selectolax installed the
+        resiliparse/trafilatura strategies don't need that tree at all.
+        """
+        parsed = {}
+
+        def get_soup() -> BeautifulSoup:
+            if 'soup' not in parsed:
+                parsed['soup'] = BeautifulSoup(html, BS_PARSER)
+            return parsed['soup']
+
+        # Strategy 1: resiliparse (fastest, comparable recall)
+        if HAS_RESILIPARSE:
+            try:
+                result = self._extract_resiliparse(html, url, get_soup)
+                if result and len(result.get('text', '')) > 200:
+                    logger.debug("Extracted with resiliparse: %s", url)
+                    return result
+            except Exception as e:
+                logger.debug("Resiliparse failed for %s: %s", url, e)
+
+        # Strategy 2: trafilatura (best quality on article-heavy pages)
         if HAS_TRAFILATURA:
             try:
-                result = self._extract_trafilatura(html, url)
+                result = self._extract_trafilatura(html, url, get_soup)
                 if result and len(result.get('text', '')) > 200:
-                    logger.debug(f"Extracted with trafilatura: {url}")
+                    logger.debug("Extracted with trafilatura: %s", url)
                     return result
             except Exception as e:
-                logger.debug(f"Trafilatura failed for {url}: {e}")
+                logger.debug("Trafilatura failed for %s: %s", url, e)
 
-        # Strategy 2: readability
+        # Strategy 3: readability
         if HAS_READABILITY:
             try:
                 result = self._extract_readability(html, url)
                 if result and len(result.get('text', '')) > 200:
-                    logger.debug(f"Extracted with readability: {url}")
+                    logger.debug("Extracted with readability: %s", url)
                     return result
             except Exception as e:
-                logger.debug(f"Readability failed for {url}: {e}")
+                logger.debug("Readability failed for %s: %s", url, e)
 
-        # Strategy 3: fallback to BeautifulSoup
-        logger.debug(f"Using BeautifulSoup fallback for {url}")
-        return self._extract_bs4(html, url)
+        # Strategy 4: fallback to BeautifulSoup
+        logger.debug("Using BeautifulSoup fallback for %s", url)
+        return self._extract_bs4(html, url, get_soup)
 
-    def _extract_trafilatura(self, html: str, url: str) -> Dict:
-        text = extract(html, include_comments=False, include_tables=True, include_images=False)
+    def _extract_trafilatura(self, html: str, url: str, get_soup=None) -> Dict:
+        # trafilatura accepts an lxml tree directly and skips its own parse
+        tree = lxml_html.fromstring(html) if HAS_LXML else html
+        text = extract(tree, include_comments=False, include_tables=True, include_images=False)
         if not text:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
-        title = self._get_title(soup, url)
+        title, content_html = self._title_and_content_html(html, url, get_soup)
+        return {
+            'title': title,
+            'text': text,
+            'lead_image': None,  # Disabled
+            'html': content_html  # Try to extract HTML if possible
+        }
+
+    def _extract_resiliparse(self, html: str, url: str, get_soup=None) -> Dict:
+        tree = HTMLTree.parse(html)
+        text = extract_plain_text(tree, main_content=True, preserve_formatting=True)
+        if not text:
+            return None
         
-        # Try to extract HTML content as well (for better formatting preservation)
-        # Use BeautifulSoup to find content, similar to _extract_bs4
-        # But we'll keep it simple - just try to find the main content area
+        # The formatted HTML fragment is found the same way as for trafilatura
+        title, content_html = self._title_and_content_html(html, url, get_soup)
+        return {
+            'title': title,
+            'text': text,
+            'lead_image': None,  # Disabled
+            'html': content_html
+        }
+
+    def _title_and_content_html(self, html: str, url: str, get_soup=None):
+        """Title and cleaned main-content HTML for the text-only strategies (resiliparse, trafilatura)"""
+        if HAS_SELECTOLAX:
+            try:
+                return self._title_and_content_html_lexbor(html, url)
+            except Exception as e:
+                logger.debug("selectolax failed for %s: %s", url, e)
+        soup = get_soup() if get_soup else BeautifulSoup(html, BS_PARSER)
+        return self._get_title(soup, url), self._main_content_html(soup, url)
+
+    def _title_and_content_html_lexbor(self, html: str, url: str):
+        """Same rules as _get_title/_main_content_html on a selectolax (lexbor, C) tree.
+        Only the chosen content element is re-parsed with BeautifulSoup for cleaning."""
+        tree = LexborHTMLParser(html)
+        
+        title = None
+        for meta in tree.css('meta'):
+            attrs = meta.attributes
+            prop = (attrs.get('property') or '').lower()
+            name = (attrs.get('name') or '').lower()
+            if prop in ['og:title', 'twitter:title'] or name in ['og:title', 'twitter:title']:
+                content = (attrs.get('content') or '').strip()
+                if content:
+                    title = content
+                    break
+        if title is None:
+            title_node = tree.css_first('title')
+            title_text = title_node.text() if title_node else ''
+            title = title_text.strip() if title_text else urlparse(url).netloc
+        
+        # get_text() in bs4 skips script/style/template strings; drop them so the lengths match
+        tree.strip_tags(['script', 'style', 'template'])
+        
+        def text_len(node) -> int:
+            return len(node.text(deep=True, separator='', strip=True))
+        
+        content = None
+        for selector in ['article', 'main', '.article-content', '.post-content', '.entry-content', '.content', '.view-content']:
+            found = tree.css_first(selector)
+            if found and text_len(found) > 200:
+                content = found
+                break
+        
+        if not content:
+            candidates = [(node, text_len(node)) for node in tree.css('div, section')]
+            valid_candidates = [c for c in candidates if c[1] > 200]
+            if valid_candidates:
+                content = max(valid_candidates, key=lambda c: c[1])[0]
+        
+        if not content:
+            return title, None
+        fragment = BeautifulSoup(content.html, BS_PARSER)
+        cleaned_content = self._clean_html_keep_formatting(fragment.find(content.tag), url, max_images=2)
+        return title, str(cleaned_content)
+
+    @staticmethod
+    def _text_lengths(soup: BeautifulSoup) -> Dict[int, int]:
+        """len(tag.get_text(strip=True)) for container tags (div, section, ...), keyed by id(tag), from one pass over the strings.
+        Calling get_text() on each div/section candidate re-walks its whole subtree (quadratic on deep pages)."""
+        lengths: Dict[int, int] = {}
+        for node in soup.descendants:
+            # get_text() only counts plain text and CDATA (not comments, script, style or template strings)
+            if type(node) not in (NavigableString, CData):
+                continue
+            length = len(node.strip())
+            if not length:
+                continue
+            parent = node.parent
+            while parent is not None:
+                lengths[id(parent)] = lengths.get(id(parent), 0) + length
+                parent = parent.parent
+        return lengths
+
+    def _main_content_html(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+        """Find the main content area and return it as cleaned HTML (None if not found)"""
+        # Keep it simple - just try to find the main content area
         content = None
         for selector in ['article', 'main', '.article-content', '.post-content', '.entry-content', '.content', '.view-content']:
             found = soup.select_one(selector)
@@ -704,30 +1047,24 @@ class ArticleExtractor:
         if not content:
             candidates = soup.find_all(['div', 'section'], recursive=True)
             if candidates:
-                valid_candidates = [c for c in candidates if len(c.get_text(strip=True)) > 200]
+                text_lengths = self._text_lengths(soup)
+                valid_candidates = [c for c in candidates if text_lengths.get(id(c), 0) > 200]
                 if valid_candidates:
-                    content = max(valid_candidates, key=lambda x: len(x.get_text(strip=True)))
-        
-        html_content = None
-        if content:
-            # Clean and format the HTML content
-            content_soup = BeautifulSoup(str(content), 'html.parser')
-            cleaned_content = self._clean_html_keep_formatting(content_soup, url, max_images=2)
-            html_content = str(cleaned_content)
+                    content = max(valid_candidates, key=lambda x: text_lengths.get(id(x), 0))
         
-        return {
-            'title': title,
-            'text': text,
-            'lead_image': None,  # Disabled
-            'html': html_content  # Try to extract HTML if possible
-        }
+        if not content:
+            return None
+        # Clean and format a copy of the content (the shared soup is left untouched)
+        content_soup = copy.copy(content)
+        cleaned_content = self._clean_html_keep_formatting(content_soup, url, max_images=2)
+        return str(cleaned_content)
 
     def _extract_readability(self, html: str, url: str) -> Dict:
         doc = Document(html)
         title = doc.title()
         content_html = doc.summary()
         
-        soup = BeautifulSoup(content_html, 'html.parser')
+        soup = BeautifulSoup(content_html, BS_PARSER)  # summary() is a full <html><body> document
         # 使用_clean_html_keep_formatting保留格式和最多2张图片
         cleaned_soup = self._clean_html_keep_formatting(soup, url, max_images=2)
         
@@ -742,7 +1079,7 @@ class ArticleExtractor:
             'lead_image': None  # Disabled
         }
 
-    def _extract_bs4(self, html: str, url: str) -> Dict:
+    def _extract_bs4(self, html: str, url: str, get_soup=None) -> Dict:
         # 验证HTML内容
         if not html:
             raise ValueError(f"HTML content is None or empty for {url}")
@@ -751,7 +1088,7 @@ class ArticleExtractor:
             raise TypeError(f"HTML content must be a string, got {type(html)} for {url}")
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = get_soup() if get_soup else BeautifulSoup(html, BS_PARSER)
         except Exception as e:
             raise ValueError(f"Failed to parse HTML for {url}: {e}")
         
@@ -773,7 +1110,7 @@ class ArticleExtractor:
             # 检查是否内容很少但HTML很大（SPA的特征）
             if len(html) > 10000 and len(body_text_preview) < 200:
                 is_spa = True
-                logger.warning(f"⚠️  检测到SPA（单页应用）页面，内容可能通过JavaScript动态加载")
+                logger.warning("⚠️  检测到SPA（单页应用）页面，内容可能通过JavaScript动态加载")
         
         # Try site-specific selectors
         domain = urlparse(url).netloc
@@ -789,7 +1126,7 @@ class ArticleExtractor:
             next_data_script = soup.find('script', id='__NEXT_DATA__')
             if next_data_script and next_data_script.string:
                 try:
-                    next_data = json.loads(next_data_script.string)
+                    next_data = _json_loads(next_data_script.string)
                     # 尝试从数据中提取内容
                     logger.debug("找到__NEXT_DATA__，尝试提取内容...")
                     # 递归查找可能的文章内容
@@ -821,13 +1158,13 @@ class ArticleExtractor:
                             'lead_image': None
                         }
                 except Exception as e:
-                    logger.debug(f"解析__NEXT_DATA__失败: {e}")
+                    logger.debug("解析__NEXT_DATA__失败: %s", e)
             
             # 尝试查找包含内容的script标签
             scripts = soup.find_all('script', type='application/json')
             for script in scripts:
                 try:
-                    data = json.loads(script.string)
+                    data = _json_loads(script.string)
                     # 尝试提取文章内容
                     if isinstance(data, dict):
                         # 递归查找可能的文本内容
@@ -896,10 +1233,10 @@ class ArticleExtractor:
                         if text_len > 100:  # 确保有足够内容
                             content = found
                             selector_used = f"{selector} ({desc})"
-                            logger.debug(f"✓ Found content using {selector_used}, length: {text_len}")
+                            logger.debug("✓ Found content using %s, length: %s", selector_used, text_len)
                             break
                 except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
+                    logger.debug("Selector %s failed: %s", selector, e)
                     continue
             
             # 如果还是没找到，尝试查找包含"游记"、"攻略"等关键词的div
@@ -913,7 +1250,7 @@ class ArticleExtractor:
                         if any(keyword in text_preview for keyword in ['游记', '攻略', '旅行', '景点', '酒店']):
                             content = div
                             selector_used = f"keyword-based: {class_str}"
-                            logger.debug(f"✓ Found content using {selector_used}")
+                            logger.debug("✓ Found content using %s", selector_used)
                             break
                             
         elif '8264.com' in domain:
@@ -932,7 +1269,7 @@ class ArticleExtractor:
                     if text_len > 100:
                         content = found
                         selector_used = selector
-                        logger.debug(f"✓ Found content using fallback selector: {selector}")
+                        logger.debug("✓ Found content using fallback selector: %s", selector)
                         break
         
         # Last resort: find the div with most text
@@ -940,14 +1277,17 @@ class ArticleExtractor:
             logger.debug("Using last resort: finding div with most text...")
             candidates = soup.find_all(['div', 'section'], recursive=True)
             if candidates:
+                # 一次遍历算出所有节点的文本长度，避免对每个候选重复 get_text()
+                text_lengths = self._text_lengths(soup)
+                text_len = lambda x: text_lengths.get(id(x), 0)
                 # 过滤掉太小的候选
-                valid_candidates = [c for c in candidates if len(c.get_text(strip=True)) > 200]
+                valid_candidates = [c for c in candidates if text_len(c) > 200]
                 if valid_candidates:
-                    content = max(valid_candidates, key=lambda x: len(x.get_text(strip=True)))
+                    content = max(valid_candidates, key=text_len)
                     selector_used = "max-text-div"
-                    logger.debug(f"✓ Found content using max-text strategy, length: {len(content.get_text(strip=True))}")
+                    logger.debug("✓ Found content using max-text strategy, length: %s", text_len(content))
                 else:
-                    content = max(candidates, key=lambda x: len(x.get_text(strip=True)))
+                    content = max(candidates, key=text_len)
                     selector_used = "max-text-div (all)"
             else:
                 content = soup.body or soup
@@ -956,8 +1296,8 @@ class ArticleExtractor:
         if not content:
             raise ValueError(f"Could not find content in HTML for {url}")
         
-        # 创建content的副本用于清理（保留原始格式和最多2张图片）
-        content_soup = BeautifulSoup(str(content), 'html.parser')
+        # 创建content的副本用于清理（保留原始格式和最多2张图片），不重新解析
+        content_soup = copy.copy(content)
         # 清理HTML但保留格式和最多2张图片
         cleaned_content = self._clean_html_keep_formatting(content_soup, url, max_images=2)
         
@@ -967,26 +1307,26 @@ class ArticleExtractor:
         
         # 记录提取信息
         if selector_used:
-            logger.debug(f"Content extracted using: {selector_used}, text length: {len(text)}")
+            logger.debug("Content extracted using: %s, text length: %s", selector_used, len(text))
             # 统计保留的图片数量
             images_count = len(cleaned_content.find_all('img'))
             if images_count > 0:
-                logger.debug(f"保留 {images_count} 张图片")
+                logger.debug("保留 %s 张图片", images_count)
         
         # 如果提取的文本太短，记录更多调试信息
         if len(text) < 100:
-            logger.warning(f"⚠ Extracted text is very short ({len(text)} chars) for {url}")
-            logger.warning(f"   Selector used: {selector_used}")
-            logger.warning(f"   Title: {title}")
-            logger.warning(f"   Text preview: {text[:200]}")
+            logger.warning("⚠ Extracted text is very short (%s chars) for %s", len(text), url)
+            logger.warning("   Selector used: %s", selector_used)
+            logger.warning("   Title: %s", title)
+            logger.warning("   Text preview: %s", text[:200])
             
             # 检查是否是SPA页面
             if is_spa or 'ctrip.com' in domain:
-                logger.error(f"❌ 这是SPA（单页应用）页面，内容通过JavaScript动态加载")
-                logger.error(f"   直接抓取HTML无法获取实际内容，需要：")
-                logger.error(f"   1. 使用浏览器自动化工具（Selenium/Playwright）")
-                logger.error(f"   2. 使用API接口（如果有）")
-                logger.error(f"   3. 尝试桌面版URL（将m.ctrip.com改为www.ctrip.com）")
+                logger.error("❌ 这是SPA（单页应用）页面，内容通过JavaScript动态加载")
+                logger.error("   直接抓取HTML无法获取实际内容，需要：")
+                logger.error("   1. 使用浏览器自动化工具（Selenium/Playwright）")
+                logger.error("   2. 使用API接口（如果有）")
+                logger.error("   3. 尝试桌面版URL（将m.ctrip.com改为www.ctrip.com）")
                 raise ValueError(
                     f"无法从SPA页面提取内容。\n"
                     f"携程移动端页面（m.ctrip.com）是单页应用，内容通过JavaScript动态加载。\n"
@@ -1000,7 +1340,7 @@ class ArticleExtractor:
             if original_body:
                 body_text = original_body.get_text(strip=True)
                 if '验证' in body_text or 'captcha' in body_text.lower():
-                    logger.error(f"❌ Likely verification page detected in body text")
+                    logger.error("❌ Likely verification page detected in body text")
         
         return {
             'title': title,
@@ -1008,9 +1348,21 @@ class ArticleExtractor:
             'html': html_fragment,
             'lead_image': None
         }
+    @staticmethod
+    def _iter_meta(soup: BeautifulSoup):
+        """<meta> tags in document order, scanning <head> first: the rest of the page (often thousands
+        of nodes) is only walked when the caller didn't find what it wanted in <head>"""
+        head = soup.head
+        head_metas = head.find_all('meta') if head else []
+        yield from head_metas
+        seen = set(map(id, head_metas))
+        for meta in soup.find_all('meta'):
+            if id(meta) not in seen:
+                yield meta
+
     def _get_title(self, soup: BeautifulSoup, url: str) -> str:
         # Try og:title, twitter:title, then <title>
-        for meta in soup.find_all('meta'):
+        for meta in self._iter_meta(soup):
             prop = meta.get('property', '').lower()
             name = meta.get('name', '').lower()
             if prop in ['og:title', 'twitter:title'] or name in ['og:title', 'twitter:title']:
@@ -1025,7 +1377,7 @@ class ArticleExtractor:
 
     def _get_lead_image(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
         # Try og:image first
-        for meta in soup.find_all('meta'):
+        for meta in self._iter_meta(soup):
             prop = meta.get('property', '').lower()
             if prop == 'og:image':
                 img_url = meta.get('content', '').strip()
@@ -1041,13 +1393,119 @@ class ArticleExtractor:
 
 
 # ----------------------------- Translation -----------------------------
+# [SEGMENT_N]...[/SEGMENT_N] markers used for batched translation requests
+_SEGMENT_RE = re.compile(r'\[SEGMENT_(\d+)\](.*?)\[/SEGMENT_\1\]', re.DOTALL)
+
 class TranslatorBackend:
+    # Short translated texts kept in memory for the run (repeated titles, stock phrases); article
+    # bodies are not memoized - they rarely repeat and the disk cache already holds their chunks
+    MEMO_SIZE = 2000
+    MEMO_MAX_CHARS = 500
+    # Shorter chunks are always sent: language ID on a few words is unreliable
+    LANGID_MIN_CHARS = 40
+
     def __init__(self, config: Config):
         self.config = config
+        self.cache: Optional['DiskCache'] = None  # 译文缓存，config.use_cache时由main设置
+        self.session: Optional[aiohttp.ClientSession] = None  # HTTP backends share one session
+        # Caps in-flight chunk requests across all chunks and articles (paces public services, avoids 429s)
+        self._chunk_sem = asyncio.Semaphore(config.translate_concurrency or config.max_concurrency)
+        self._memo: OrderedDict = OrderedDict()
+        # 相同文本并发请求时共享同一个翻译任务：key -> (任务, 结果中的下标)
+        self._inflight: Dict[bytes, Tuple[asyncio.Task, int]] = {}
+        # The semaphore bounds concurrency, the limiter bounds requests per minute (API RPM quotas)
+        self._limiter = None
+        if config.translate_rpm:
+            self._limiter = (AsyncLimiter or TokenBucket)(config.translate_rpm, 60)
 
     async def translate(self, text: str) -> str:
         raise NotImplementedError
 
+    async def translate_many(self, texts: List[str]) -> List[str]:
+        """Translate several independent texts (e.g. title and body); backends may batch them into fewer requests.
+        Texts already translated in this run, or currently being translated, are not requested again."""
+        keys = [_memory_key(self._cache_key(text, 'memo')) for text in texts]
+        results: Dict[bytes, str] = {}
+        waiting: Dict[bytes, Tuple[asyncio.Task, int]] = {}
+        todo: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in results or key in waiting or key in todo:
+                continue
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                results[key] = self._memo[key]
+            elif key in self._inflight:
+                waiting[key] = self._inflight[key]
+            else:
+                todo[key] = text
+        
+        if todo:
+            # The request runs as its own task: a cancelled caller (this one included) only stops
+            # waiting, and the other articles sharing these texts still get the result
+            task = asyncio.ensure_future(self._translate_many(list(todo.values())))
+            for i, key in enumerate(todo):
+                self._inflight[key] = waiting[key] = (task, i)
+            items = list(todo.items())
+            task.add_done_callback(lambda done: self._finish_inflight(items, done))
+        
+        for key, (task, i) in waiting.items():
+            results[key] = (await asyncio.shield(task))[i]
+        return [results[key] for key in keys]
+
+    def _finish_inflight(self, items: List[Tuple[bytes, str]], task: asyncio.Task):
+        """Done callback of a shared translate_many task: release its in-flight keys and memoize short results"""
+        for key, _ in items:
+            if self._inflight.get(key, (None,))[0] is task:
+                del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return  # exception() also marks it retrieved when no caller is left waiting
+        for (key, text), value in zip(items, task.result()):
+            if len(text) <= self.MEMO_MAX_CHARS:
+                self._memo[key] = value
+                if len(self._memo) > self.MEMO_SIZE:
+                    self._memo.popitem(last=False)
+
+    async def _translate_many(self, texts: List[str]) -> List[str]:
+        """Translate distinct texts; the default runs translate() on each concurrently"""
+        return list(await asyncio.gather(*[self.translate(text) for text in texts]))
+
+    async def _throttle(self):
+        """Wait for a request slot under translate_rpm (no-op when unlimited)"""
+        if self._limiter is not None:
+            await self._limiter.acquire()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the backend's ClientSession so TLS connections are reused across chunks/articles"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=self.config.translate_concurrency or self.config.max_concurrency, ttl_dns_cache=300, keepalive_timeout=60))
+        return self.session
+
+    async def aclose(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    def _in_target_lang(self, chunk: str) -> bool:
+        """True if the chunk is already in the target language (needs py3langid; rewrite mode always translates)"""
+        if py3langid is None or self.config.rewrite_mode or len(chunk) < self.LANGID_MIN_CHARS:
+            return False
+        target_base, _, target_variant = self.config.target_lang.lower().partition('-')
+        # py3langid only names the base language, so a zh-CN chunk looks "done" for a zh-TW target:
+        # with a region/script variant, only skip when the source is known to be another language
+        if target_variant and self.config.source_lang.lower().partition('-')[0] in (target_base, 'auto'):
+            return False
+        return py3langid.classify(chunk)[0] == target_base
+
+    def _cache_key(self, text: str, kind: str = 'chunk') -> str:
+        return f"{type(self).__name__}|{kind}|{self.config.source_lang}|{self.config.target_lang}|{self.config.rewrite_mode}|{text}"
+
+    async def _cache_get(self, text: str, kind: str = 'chunk') -> Optional[str]:
+        return await self.cache.get(self._cache_key(text, kind)) if self.cache else None
+
+    async def _cache_set(self, text: str, translated: str, kind: str = 'chunk'):
+        if self.cache:
+            await self.cache.set(self._cache_key(text, kind), translated)
+
     async def translate_html(self, html_content: str) -> str:
         """
         Translate HTML content while preserving structure, tags, and attributes (including styles).
@@ -1059,6 +1517,7 @@ class TranslatorBackend:
             return html_content
         
         try:
+            # html.parser on purpose: str(soup) must give back the fragment as-is, lxml would wrap it in <html><body>
             soup = BeautifulSoup(html_content, 'html.parser')
             from bs4 import NavigableString, Tag
             
@@ -1109,7 +1568,7 @@ class TranslatorBackend:
                     text_node, text = text_nodes[0]
                     text_nodes_to_translate.append((text_node, text, [text_nodes[0]]))
             
-            logger.info(f"📄 Found {len(text_nodes_to_translate)} text node groups with Chinese characters")
+            logger.info("📄 Found %s text node groups with Chinese characters", len(text_nodes_to_translate))
             
             # Strategy: Use numbered placeholder-based batch translation
             # 1. Replace Chinese text nodes with numbered placeholders (more reliable)
@@ -1148,7 +1607,7 @@ class TranslatorBackend:
             
             combined_text = "".join(combined_parts)
             
-            logger.info(f"📄 Translating {len(texts_to_translate)} text segments in one batch ({len(combined_text)} chars total)")
+            logger.info("📄 Translating %s text segments in one batch (%s chars total)", len(texts_to_translate), len(combined_text))
             
             try:
                 # Translate the entire combined text directly without chunking
@@ -1161,9 +1620,7 @@ class TranslatorBackend:
                     translated_combined = await self.translate(combined_text)
                 
                 # Extract translated segments using regex to find [SEGMENT_N]...[/SEGMENT_N] markers
-                import re
-                segment_pattern = re.compile(r'\[SEGMENT_(\d+)\](.*?)\[/SEGMENT_\1\]', re.DOTALL)
-                matches = segment_pattern.findall(translated_combined)
+                matches = _SEGMENT_RE.findall(translated_combined)
                 
                 # Create a dictionary of segment index to translated text
                 translated_dict = {}
@@ -1179,14 +1636,14 @@ class TranslatorBackend:
                         translated_texts.append(translated_dict[i])
                     else:
                         # Segment not found in translation, keep original
-                        logger.warning(f"Segment {i} not found in translated output, keeping original")
+                        logger.warning("Segment %s not found in translated output, keeping original", i)
                         translated_texts.append(texts_to_translate[i])
                 
                 if len(translated_texts) != len(texts_to_translate):
                     raise ValueError(f"Translation segment count mismatch: {len(translated_texts)} != {len(texts_to_translate)}")
                 
             except Exception as e:
-                logger.warning(f"Batch translation with markers failed: {e}, falling back to separator method")
+                logger.warning("Batch translation with markers failed: %s, falling back to separator method", e)
                 # Fallback: use a more unique separator
                 separator = "|||TRANSLATION_SEPARATOR_XYZ|||"
                 combined_text = separator.join(texts_to_translate)
@@ -1198,9 +1655,7 @@ class TranslatorBackend:
                         marked_text = "".join([f"[SEGMENT_{i}]{text}[/SEGMENT_{i}]" for i, text in enumerate(texts_to_translate)])
                         translated_combined = await self._translate_batch(marked_text)
                         # Extract using markers
-                        import re
-                        segment_pattern = re.compile(r'\[SEGMENT_(\d+)\](.*?)\[/SEGMENT_\1\]', re.DOTALL)
-                        matches = segment_pattern.findall(translated_combined)
+                        matches = _SEGMENT_RE.findall(translated_combined)
                         translated_dict = {int(idx): text for idx, text in matches}
                         translated_texts = [translated_dict.get(i, texts_to_translate[i]) for i in range(len(texts_to_translate))]
                     else:
@@ -1210,7 +1665,7 @@ class TranslatorBackend:
                     if len(translated_texts) != len(texts_to_translate):
                         raise ValueError(f"Separator split failed: {len(translated_texts)} != {len(texts_to_translate)}")
                 except Exception as e2:
-                    logger.error(f"All batch translation methods failed: {e2}, keeping original HTML")
+                    logger.error("All batch translation methods failed: %s, keeping original HTML", e2)
                     return html_content
             
             # Step 4: Replace placeholders with translated text
@@ -1237,11 +1692,11 @@ class TranslatorBackend:
                 
                 result_html = result_html.replace(placeholder, translated_text)
             
-            logger.info(f"✓ HTML translation completed ({len(texts_to_translate)} segments translated in 1 batch)")
+            logger.info("✓ HTML translation completed (%s segments translated in 1 batch)", len(texts_to_translate))
             return result_html
             
         except Exception as e:
-            logger.error(f"Error translating HTML: {e}, returning original HTML")
+            logger.error("Error translating HTML: %s, returning original HTML", e)
             import traceback
             logger.error(traceback.format_exc())
             return html_content
@@ -1249,22 +1704,21 @@ class TranslatorBackend:
     def _chunk_text(self, text: str) -> List[str]:
         """Smart chunking by paragraphs"""
         paragraphs = text.split('\n\n')
+        limit = self.config.chunk_size
+        if len(text) - 2 * (len(paragraphs) - 1) <= limit:
+            return [text]  # Fits in one chunk (the common case for titles and short articles)
+        
         chunks = []
-        current_chunk = []
+        start = 0
         current_size = 0
-        
-        for para in paragraphs:
-            para_size = len(para)
-            if current_size + para_size > self.config.chunk_size and current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
-                current_chunk = [para]
+        for i, para_size in enumerate(map(len, paragraphs)):
+            if current_size + para_size > limit and i > start:
+                chunks.append('\n\n'.join(paragraphs[start:i]))
+                start = i
                 current_size = para_size
             else:
-                current_chunk.append(para)
                 current_size += para_size
-        
-        if current_chunk:
-            chunks.append('\n\n'.join(current_chunk))
+        chunks.append('\n\n'.join(paragraphs[start:]))
         
         return chunks
 
@@ -1278,58 +1732,70 @@ class SimpleBackend(TranslatorBackend):
         # Try multiple services as fallback
         self.services = ['lingva', 'mymemory', 'simplytranslate']
         self.current_service = 0
-        logger.info(f"✓ Simple Translator ready: {config.source_lang} → {config.target_lang}")
+        # service -> time.monotonic() until which it is skipped (set from 429 Retry-After)
+        self._blocked_until: Dict[str, float] = {}
+        logger.info("✓ Simple Translator ready: %s → %s", config.source_lang, config.target_lang)
 
     async def translate(self, text: str) -> str:
-        import warnings
-        import urllib3
-        # Disable SSL warnings
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        warnings.filterwarnings('ignore', message='Unverified HTTPS request')
-        
-        loop = asyncio.get_running_loop()
+        # All services share the backend's aiohttp session (keep-alive, bounded by the connector limit)
+        session = await self._get_session()
+        translators = {
+            service: SimpleTranslator(session, self.config.source_lang, self.config.target_lang, service)
+            for service in self.services
+        }
         chunks = self._chunk_text(text)
         
         async def _translate_chunk(chunk: str) -> str:
-            # Add delay to respect rate limits
-            await asyncio.sleep(1)
+            cached = await self._cache_get(chunk)
+            if cached is not None:
+                return cached
+            if self._in_target_lang(chunk):
+                return chunk
             
-            # Try different services until one works
-            for service in self.services:
-                try:
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda s=service: SimpleTranslator(
-                            self.config.source_lang, 
-                            self.config.target_lang, 
-                            s
-                        ).translate(chunk)
-                    )
-                    logger.debug(f"✓ Translated with {service}")
-                    return result
-                except Exception as e:
-                    logger.debug(f"Service {service} failed: {e}")
-                    continue
+            # Try different services until one works (the semaphore paces requests instead of a fixed sleep);
+            # a service that answered 429 is skipped until its Retry-After has passed
+            async with self._chunk_sem:
+                for service in self.services:
+                    if self._blocked_until.get(service, 0) > time.monotonic():
+                        continue
+                    try:
+                        await self._throttle()
+                        result = await translators[service].translate(chunk)
+                        logger.debug("✓ Translated with %s", service)
+                        await self._cache_set(chunk, result)
+                        return result
+                    except RateLimitedError as e:
+                        self._blocked_until[service] = time.monotonic() + e.retry_after
+                        logger.warning("⚠ %s", e)
+                        continue
+                    except Exception as e:
+                        logger.debug("Service %s failed: %s", service, e)
+                        continue
             
             # If all services fail, return original
-            logger.warning(f"All translation services failed, using original text")
+            logger.warning("All translation services failed, using original text")
             return chunk
         
-        results = await asyncio.gather(*[_translate_chunk(c) for c in chunks], return_exceptions=True)
+        # Repeated chunks (boilerplate paragraphs) are requested once
+        unique = list(dict.fromkeys(chunks))
+        results = await asyncio.gather(*[_translate_chunk(c) for c in unique], return_exceptions=True)
         
-        translated_parts = []
-        for i, result in enumerate(results):
+        translated = {}
+        for i, (chunk, result) in enumerate(zip(unique, results)):
             if isinstance(result, Exception):
-                logger.error(f"Chunk {i} failed: {result}")
-                translated_parts.append(chunks[i])
+                logger.error("Chunk %s failed: %s", i, result)
+                translated[chunk] = chunk
             else:
-                translated_parts.append(result)
+                translated[chunk] = result
         
-        return '\n\n'.join(translated_parts)
+        return '\n\n'.join(translated[chunk] for chunk in chunks)
 
 
 class DeepSeekBackend(TranslatorBackend):
     """DeepSeek API - OpenAI compatible interface"""
+    # Max characters of chunks packed into one chat-completion request
+    BATCH_CHARS = 8000
+
     def __init__(self, config: Config):
         super().__init__(config)
         if not config.deepseek_api_key:
@@ -1350,9 +1816,9 @@ class DeepSeekBackend(TranslatorBackend):
         self.target_name = lang_names.get(config.target_lang, config.target_lang)
         
         if self.proxy:
-            logger.info(f"✓ DeepSeek Translator ready (via proxy {self.proxy}): {self.source_name} → {self.target_name}")
+            logger.info("✓ DeepSeek Translator ready (via proxy %s): %s → %s", self.proxy, self.source_name, self.target_name)
         else:
-            logger.info(f"✓ DeepSeek Translator ready: {self.source_name} → {self.target_name}")
+            logger.info("✓ DeepSeek Translator ready: %s → %s", self.source_name, self.target_name)
 
     async def _translate_batch(self, text: str) -> str:
         """
@@ -1362,12 +1828,12 @@ class DeepSeekBackend(TranslatorBackend):
         if not self.api_key:
             raise RuntimeError("DEEPSEEK_API_KEY not set")
         
-        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        cached = await self._cache_get(text, kind='batch')
+        if cached is not None:
+            logger.info("✓ Batch translation from cache")
+            return cached
         
-        # Create connector with proxy support
-        connector = None
-        if self.proxy:
-            connector = aiohttp.TCPConnector()
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
         
         rewrite_mode = self.config.rewrite_mode
         if rewrite_mode:
@@ -1448,46 +1914,45 @@ Output ONLY the plain translated text with markers preserved, nothing else."""
         
         proxy_url = self.proxy if self.proxy else None
         
-        async with aiohttp.ClientSession(connector=connector) as session:
+        session = await self._get_session()
+        async with self._chunk_sem:
+            await self._throttle()
             async with session.post(
                 self.url,
                 headers=headers,
-                json=payload,
+                data=_json_dumps(payload),
                 proxy=proxy_url,
                 timeout=aiohttp.ClientTimeout(total=timeout)
             ) as r:
                 r.raise_for_status()
-                js = await r.json()
-                
+                js = _json_loads(await r.read())
+            
                 if 'choices' not in js or not js['choices']:
                     raise RuntimeError(f"Unexpected API response: {js}")
-                
+            
                 translated = js['choices'][0]['message']['content'].strip()
                 if not translated:
                     raise RuntimeError("Empty response from API")
-                
+            
+                await self._cache_set(text, translated, kind='batch')
                 return translated
 
-    async def translate(self, text: str) -> str:
-        if not self.api_key:
-            raise RuntimeError("DEEPSEEK_API_KEY not set")
-        
-        chunks = self._chunk_text(text)
-        out = []
-        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+    async def _translate_chunk(self, session: aiohttp.ClientSession, headers: Dict[str, str],
+                               idx: int, total: int, chunk: str) -> str:
+        """Translate one chunk with retries (called concurrently from translate)"""
+        cached = await self._cache_get(chunk)
+        if cached is not None:
+            logger.info("✓ Chunk %s/%s from cache", idx, total)
+            return cached
+        if self._in_target_lang(chunk):
+            logger.info("✓ Chunk %s/%s already in %s, kept as-is", idx, total, self.target_name)
+            return chunk
         
-        # Create connector with proxy support
-        connector = None
-        if self.proxy:
-            connector = aiohttp.TCPConnector()
-        
-        async with aiohttp.ClientSession(connector=connector) as session:
-            for idx, chunk in enumerate(chunks, 1):
-                # Build instruction based on source language and rewrite mode
-                rewrite_mode = self.config.rewrite_mode
-                if rewrite_mode:
-                    if self.config.source_lang == 'auto':
-                        system_prompt = f"""You are a professional content writer and editor. Your task is to:
+        # Build instruction based on source language and rewrite mode
+        rewrite_mode = self.config.rewrite_mode
+        if rewrite_mode:
+            if self.config.source_lang == 'auto':
+                system_prompt = f"""You are a professional content writer and editor. Your task is to:
 1. Translate the content into {self.target_name}
 2. Rewrite and refine the content to make it more engaging and well-structured
 3. Organize content into clear paragraphs with logical flow
@@ -1496,8 +1961,8 @@ Output ONLY the plain translated text with markers preserved, nothing else."""
 6. Use a professional yet accessible tone
 
 Output ONLY the rewritten content in {self.target_name}, with clear paragraph breaks (use double newlines between paragraphs)."""
-                    else:
-                        system_prompt = f"""You are a professional content writer and editor. Your task is to:
+            else:
+                system_prompt = f"""You are a professional content writer and editor. Your task is to:
 1. Translate the {self.source_name} content into {self.target_name}
 2. Rewrite and refine the content to make it more engaging and well-structured
 3. Organize content into clear paragraphs with logical flow
@@ -1506,10 +1971,10 @@ Output ONLY the rewritten content in {self.target_name}, with clear paragraph br
 6. Use a professional yet accessible tone
 
 Output ONLY the rewritten content in {self.target_name}, with clear paragraph breaks (use double newlines between paragraphs)."""
-                    user_prompt = f"Please rewrite and optimize the following content:\n\n{chunk}"
-                else:
-                    if self.config.source_lang == 'auto':
-                        system_prompt = f"""You are a professional translator. Your task is to:
+            user_prompt = f"Please rewrite and optimize the following content:\n\n{chunk}"
+        else:
+            if self.config.source_lang == 'auto':
+                system_prompt = f"""You are a professional translator. Your task is to:
 1. Translate the text into {self.target_name} accurately while preserving the original meaning and tone
 2. Do NOT use Markdown formatting symbols (**, __, *, _)
 3. NUMBERING RULES - VERY IMPORTANT:
@@ -1521,8 +1986,8 @@ Output ONLY the rewritten content in {self.target_name}, with clear paragraph br
 4. Do NOT add extra formatting, numbering, or duplicate existing numbering
 
 Output ONLY the plain translated text, nothing else."""
-                    else:
-                        system_prompt = f"""You are a professional translator. Your task is to:
+            else:
+                system_prompt = f"""You are a professional translator. Your task is to:
 1. Translate the {self.source_name} text into {self.target_name} accurately while preserving the original meaning and tone
 2. Do NOT use Markdown formatting symbols (**, __, *, _)
 3. NUMBERING RULES - VERY IMPORTANT:
@@ -1534,114 +1999,180 @@ Output ONLY the plain translated text, nothing else."""
 4. Do NOT add extra formatting, numbering, or duplicate existing numbering
 
 Output ONLY the plain translated text, nothing else."""
-                    user_prompt = f"Translate to {self.target_name}:\n\n{chunk}"
-                
-                # Calculate dynamic timeout based on chunk size and mode
-                # Base timeout: 60s for translation, 120s for rewrite
-                # Add extra time based on chunk size (roughly 1s per 100 chars)
-                base_timeout = 180 if rewrite_mode else 90
-                size_bonus = max(len(chunk) // 100, 0)
-                chunk_timeout = min(base_timeout + size_bonus, 300)  # Cap at 5 minutes
-                
-                # Adjust max_tokens based on chunk size
-                estimated_tokens = len(chunk) // 3  # Rough estimate: 3 chars per token
-                max_tokens = min(int(estimated_tokens * 1.5), 8000)  # Allow 50% more for output, cap at 8k
-                
-                payload = {
-                    "model": "deepseek-chat",
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "temperature": 0.7 if rewrite_mode else 0.3,
-                    "max_tokens": max_tokens
-                }
-                
-                # Use proxy if configured
-                proxy_url = self.proxy if self.proxy else None
-                
-                # Retry logic for each chunk
-                max_retries = 2
-                last_error = None
+            user_prompt = f"Translate to {self.target_name}:\n\n{chunk}"
+        
+        # Calculate dynamic timeout based on chunk size and mode
+        # Base timeout: 60s for translation, 120s for rewrite
+        # Add extra time based on chunk size (roughly 1s per 100 chars)
+        base_timeout = 180 if rewrite_mode else 90
+        size_bonus = max(len(chunk) // 100, 0)
+        chunk_timeout = min(base_timeout + size_bonus, 300)  # Cap at 5 minutes
+        
+        # Adjust max_tokens based on chunk size
+        estimated_tokens = len(chunk) // 3  # Rough estimate: 3 chars per token
+        max_tokens = min(int(estimated_tokens * 1.5), 8000)  # Allow 50% more for output, cap at 8k
+        
+        payload = {
+            "model": "deepseek-chat",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.7 if rewrite_mode else 0.3,
+            "max_tokens": max_tokens
+        }
+        
+        # Use proxy if configured
+        proxy_url = self.proxy if self.proxy else None
+        
+        # Retry logic for each chunk
+        max_retries = 2
+        last_error = None
+        
+        for retry in range(max_retries + 1):
+            try:
+                logger.info("🔄 Processing chunk %s/%s (size: %s chars, timeout: %ss, retry: %s)", idx, total, len(chunk), chunk_timeout, retry)
                 
-                for retry in range(max_retries + 1):
-                    try:
-                        logger.info(f"🔄 Processing chunk {idx}/{len(chunks)} (size: {len(chunk)} chars, timeout: {chunk_timeout}s, retry: {retry})")
-                        
-                        async with session.post(
-                            self.url, 
-                            headers=headers, 
-                            json=payload, 
-                            proxy=proxy_url,
-                            timeout=aiohttp.ClientTimeout(total=chunk_timeout)
-                        ) as r:
-                            r.raise_for_status()
-                            js = await r.json()
-                            
-                            if 'choices' not in js or not js['choices']:
-                                raise RuntimeError(f"Unexpected API response: {js}")
-                            
-                            txt = js['choices'][0]['message']['content'].strip()
-                            if not txt:
-                                raise RuntimeError("Empty response from API")
-                            
-                            out.append(txt)
-                            logger.info(f"✓ Chunk {idx}/{len(chunks)} completed ({len(txt)} chars)")
-                            break  # Success, exit retry loop
-                            
-                    except asyncio.TimeoutError:
-                        last_error = f"Timeout after {chunk_timeout}s"
-                        if retry < max_retries:
-                            wait_time = (retry + 1) * 5
-                            logger.warning(f"⏱ Chunk {idx} timeout, retrying in {wait_time}s... (attempt {retry + 1}/{max_retries + 1})")
-                            await asyncio.sleep(wait_time)
-                            # Increase timeout for retry
-                            chunk_timeout = min(chunk_timeout + 60, 300)
-                        else:
-                            logger.error(f"❌ Chunk {idx} failed after {max_retries + 1} attempts: {last_error}")
-                            raise RuntimeError(
-                                f"DeepSeek API timeout after {max_retries + 1} attempts. "
-                                f"Chunk size: {len(chunk)} chars. "
-                                f"Try reducing chunk_size (current: {self.config.chunk_size}) or check your network connection."
-                            )
-                    except aiohttp.ClientResponseError as e:
-                        last_error = f"HTTP {e.status}: {e.message}"
-                        if e.status == 429:  # Rate limit
-                            wait_time = (retry + 1) * 10
-                            logger.warning(f"⚠ Rate limited, waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        elif e.status >= 500 and retry < max_retries:  # Server error, retry
-                            wait_time = (retry + 1) * 5
-                            logger.warning(f"⚠ Server error {e.status}, retrying in {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            raise RuntimeError(f"DeepSeek API HTTP error: {last_error}")
-                    except Exception as e:
-                        last_error = str(e)
-                        if "Cannot connect" in str(e) or "ClientConnectorError" in str(e):
-                            if retry < max_retries:
-                                wait_time = (retry + 1) * 5
-                                logger.warning(f"⚠ Connection error, retrying in {wait_time}s...")
-                                await asyncio.sleep(wait_time)
-                                continue
-                            raise RuntimeError(
-                                f"Cannot connect to DeepSeek API after {max_retries + 1} attempts. "
-                                f"Check your network connection or set proxy: proxy: http://127.0.0.1:7890"
-                            )
-                        elif retry < max_retries:
-                            wait_time = (retry + 1) * 5
-                            logger.warning(f"⚠ Error: {e}, retrying in {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            raise RuntimeError(f"DeepSeek translate error: {last_error}")
+                await self._throttle()
+                async with session.post(
+                    self.url, 
+                    headers=headers, 
+                    data=_json_dumps(payload), 
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=chunk_timeout)
+                ) as r:
+                    r.raise_for_status()
+                    js = _json_loads(await r.read())
+                    
+                    if 'choices' not in js or not js['choices']:
+                        raise RuntimeError(f"Unexpected API response: {js}")
+                    
+                    txt = js['choices'][0]['message']['content'].strip()
+                    if not txt:
+                        raise RuntimeError("Empty response from API")
+                    
+                    await self._cache_set(chunk, txt)
+                    logger.info("✓ Chunk %s/%s completed (%s chars)", idx, total, len(txt))
+                    return txt  # Success
+                    
+            except asyncio.TimeoutError:
+                last_error = f"Timeout after {chunk_timeout}s"
+                if retry < max_retries:
+                    wait_time = (retry + 1) * 5
+                    logger.warning("⏱ Chunk %s timeout, retrying in %ss... (attempt %s/%s)", idx, wait_time, retry + 1, max_retries + 1)
+                    await asyncio.sleep(wait_time)
+                    # Increase timeout for retry
+                    chunk_timeout = min(chunk_timeout + 60, 300)
+                else:
+                    logger.error("❌ Chunk %s failed after %s attempts: %s", idx, max_retries + 1, last_error)
+                    raise RuntimeError(
+                        f"DeepSeek API timeout after {max_retries + 1} attempts. "
+                        f"Chunk size: {len(chunk)} chars. "
+                        f"Try reducing chunk_size (current: {self.config.chunk_size}) or check your network connection."
+                    )
+            except aiohttp.ClientResponseError as e:
+                last_error = f"HTTP {e.status}: {e.message}"
+                if e.status == 429:  # Rate limit
+                    wait_time = (retry + 1) * 10
+                    logger.warning("⚠ Rate limited, waiting %ss...", wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+                elif e.status >= 500 and retry < max_retries:  # Server error, retry
+                    wait_time = (retry + 1) * 5
+                    logger.warning("⚠ Server error %s, retrying in %ss...", e.status, wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    raise RuntimeError(f"DeepSeek API HTTP error: {last_error}")
+            except Exception as e:
+                last_error = str(e)
+                if "Cannot connect" in str(e) or "ClientConnectorError" in str(e):
+                    if retry < max_retries:
+                        wait_time = (retry + 1) * 5
+                        logger.warning("⚠ Connection error, retrying in %ss...", wait_time)
+                        await asyncio.sleep(wait_time)
+                        continue
+                    raise RuntimeError(
+                        f"Cannot connect to DeepSeek API after {max_retries + 1} attempts. "
+                        f"Check your network connection or set proxy: proxy: http://127.0.0.1:7890"
+                    )
+                elif retry < max_retries:
+                    wait_time = (retry + 1) * 5
+                    logger.warning("⚠ Error: %s, retrying in %ss...", e, wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
                 else:
-                    # All retries exhausted
-                    raise RuntimeError(f"Failed to translate chunk {idx} after {max_retries + 1} attempts: {last_error}")
+                    raise RuntimeError(f"DeepSeek translate error: {last_error}")
+        else:
+            # All retries exhausted
+            raise RuntimeError(f"Failed to translate chunk {idx} after {max_retries + 1} attempts: {last_error}")
+
+    async def translate(self, text: str) -> str:
+        return (await self.translate_many([text]))[0]
+
+    async def _translate_many(self, texts: List[str]) -> List[str]:
+        """Translate several texts at once: their chunks share the batched requests below"""
+        if not self.api_key:
+            raise RuntimeError("DEEPSEEK_API_KEY not set")
+        
+        chunk_lists = [self._chunk_text(text) for text in texts]
+        # Chunks repeated within or across the texts (shared boilerplate) are translated once
+        chunks = list(dict.fromkeys(chunk for chunk_list in chunk_lists for chunk in chunk_list))
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        
+        session = await self._get_session()
+        total = len(chunks)
         
-        return '\n\n'.join(out)
+        async def _bounded(idx: int, chunk: str) -> str:
+            async with self._chunk_sem:
+                return await self._translate_chunk(session, headers, idx, total, chunk)
+        
+        async def _run_group(indices: List[int]) -> List[str]:
+            if len(indices) > 1:
+                try:
+                    return await self._translate_chunk_group([chunks[i] for i in indices])
+                except Exception as e:
+                    logger.warning("Batched request for chunks %s-%s failed (%s), translating them one by one",
+                                   indices[0] + 1, indices[-1] + 1, e)
+            return await asyncio.gather(*[_bounded(i + 1, chunks[i]) for i in indices])
+        
+        # Consecutive chunks are packed into one request up to BATCH_CHARS; the groups are
+        # translated concurrently (bounded by the semaphore) and gather keeps their order
+        results = await asyncio.gather(*[_run_group(group) for group in await self._pack_chunks(chunks)],
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        translated = dict(zip(chunks, (part for group in results for part in group)))
+        return ['\n\n'.join(translated[chunk] for chunk in chunk_list) for chunk_list in chunk_lists]
+
+    async def _pack_chunks(self, chunks: List[str]) -> List[List[int]]:
+        """Group consecutive chunk indices that need a request so each group fits in BATCH_CHARS"""
+        groups = []
+        current, current_size = [], 0
+        for i, chunk in enumerate(chunks):
+            skip = await self._cache_get(chunk) is not None or self._in_target_lang(chunk)
+            if current and (skip or current_size + len(chunk) > self.BATCH_CHARS):
+                groups.append(current)
+                current, current_size = [], 0
+            if skip:
+                groups.append([i])  # _translate_chunk returns it from the cache or as-is
+                continue
+            current.append(i)
+            current_size += len(chunk)
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _translate_chunk_group(self, group: List[str]) -> List[str]:
+        """Translate several chunks in one chat-completion request using [SEGMENT_N] markers"""
+        marked = ''.join(f"[SEGMENT_{i}]{chunk}[/SEGMENT_{i}]" for i, chunk in enumerate(group))
+        translated = dict((int(i), part.strip()) for i, part in _SEGMENT_RE.findall(await self._translate_batch(marked)))
+        if len(translated) != len(group) or not all(translated.get(i) for i in range(len(group))):
+            raise ValueError(f"expected {len(group)} segments, got {len(translated)}")
+        for i, chunk in enumerate(group):
+            await self._cache_set(chunk, translated[i])
+        return [translated[i] for i in range(len(group))]
 
 
 def create_translator(config: Config) -> TranslatorBackend:
@@ -1670,30 +2201,146 @@ def create_translator(config: Config) -> TranslatorBackend:
 
 
 # ----------------------------- Cache -----------------------------
+def _hash_key(key: str) -> str:
+    """Cache file name for a key: the hash is only used for indexing, so a fast 128-bit blake2b is enough.
+    It stays blake2b (stdlib) so on-disk caches remain valid whichever optional packages are installed."""
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _memory_key(key: str) -> bytes:
+    """128-bit digest for in-process lookups (never persisted): blake3 or xxh3 when installed, else blake2b"""
+    data = key.encode('utf-8')
+    if blake3:
+        return blake3.blake3(data).digest(length=16)
+    if xxhash:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 class Cache:
-    def __init__(self, cache_dir: Path):
+    """Processed-URL cache: in-memory LRU in front of a single SQLite database (WAL mode)
+    
+    One indexed table instead of one JSON file per URL; queries run in a worker thread so
+    cache hits don't stall the event loop. Entries written by older versions as <hash>.json
+    files (sha256 or blake2b names) are still read, and moved into the database, on a miss.
+    """
+    def __init__(self, cache_dir: Path, max_memory_items: int = 1024):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_memory_items = max_memory_items
+        self._mem: OrderedDict = OrderedDict()
+        # 一个连接在线程间共享，由锁串行化
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(cache_dir / 'cache.sqlite'), isolation_level=None, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, data BLOB NOT NULL)')
 
     def _get_key(self, url: str) -> str:
-        return hashlib.sha256(url.encode()).hexdigest()
+        return _hash_key(url)
 
-    def get(self, url: str) -> Optional[Dict]:
+    def _remember(self, url: str, data: Dict):
+        self._mem[url] = data
+        self._mem.move_to_end(url)
+        if len(self._mem) > self.max_memory_items:
+            self._mem.popitem(last=False)
+
+    def _read(self, url: str) -> Optional[bytes]:
         key = self._get_key(url)
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
+        with self._lock:
+            row = self._db.execute('SELECT data FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            return row[0]
+        for legacy_name in (key, hashlib.sha256(url.encode()).hexdigest()):
+            legacy_file = self.cache_dir / f"{legacy_name}.json"
             try:
-                with open(cache_file) as f:
-                    return json.load(f)
-            except:
-                return None
+                raw = legacy_file.read_bytes()
+            except OSError:
+                continue
+            self._write(key, raw)
+            legacy_file.unlink(missing_ok=True)
+            return raw
         return None
 
-    def set(self, url: str, data: Dict):
-        key = self._get_key(url)
-        cache_file = self.cache_dir / f"{key}.json"
-        with open(cache_file, 'w') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _write(self, key: str, raw: bytes):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO cache (key, data) VALUES (?, ?)', (key, raw))
+
+    async def get(self, url: str) -> Optional[Dict]:
+        if url in self._mem:
+            self._mem.move_to_end(url)
+            return self._mem[url]
+        
+        try:
+            raw = await asyncio.to_thread(self._read, url)
+            if raw is None:
+                return None
+            data = _json_loads(raw)
+        except Exception:
+            return None
+        self._remember(url, data)
+        return data
+
+    async def set(self, url: str, data: Dict):
+        self._remember(url, data)
+        await asyncio.to_thread(self._write, self._get_key(url), _json_dumps(data))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class DiskCache:
+    """Two-tier cache for fetched pages and translated chunks
+    
+    An in-memory LRU sits in front of gzip'd files named by a hash of the key, so repeat
+    runs skip both the network fetch and the translation API call. Memory hits return
+    directly; file reads/writes and (de)compression run in a worker thread.
+    """
+    def __init__(self, cache_dir: Path, max_memory_items: int = 1024):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_memory_items = max_memory_items
+        self._memory: OrderedDict = OrderedDict()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{_hash_key(key)}.gz"
+
+    def _remember(self, key: str, value: str):
+        if not self.max_memory_items:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[str]:
+        try:
+            return gzip.decompress(self._path(key).read_bytes()).decode('utf-8')
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+    def _store(self, key: str, value: str):
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(gzip.compress(value.encode('utf-8'), compresslevel=6))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Failed to write cache entry %s: %s", path, e)
+
+    async def get(self, key: str) -> Optional[str]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        value = await asyncio.to_thread(self._load, key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    async def set(self, key: str, value: str):
+        self._remember(key, value)
+        await asyncio.to_thread(self._store, key, value)
 
 
 # ----------------------------- HTML Builder -----------------------------
@@ -1821,6 +2468,28 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
+_STYLE_RE = re.compile(r'<style>(.*?)</style>', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r' ?([{};,:]) ?')
+
+
+def _minify_css(css: str) -> str:
+    """Collapse the template's indented CSS rules into one compact line ('{{'/'}}' escapes are kept)"""
+    css = _CSS_PUNCT_RE.sub(r'\1', _CSS_SPACE_RE.sub(' ', css).strip())
+    return css.replace(';}', '}')
+
+
+# HTML_TEMPLATE pre-split once into (literal, field) pairs; '{{'/'}}' escapes are already resolved,
+# so rendering is a single join instead of re-scanning the whole template with str.format.
+# The inline <style> block is minified first (the doubled braces survive), so articles don't carry its indentation.
+_TEMPLATE_PARTS = [(literal, field) for literal, field, _, _ in string.Formatter().parse(
+    _STYLE_RE.sub(lambda m: f'<style>{_minify_css(m.group(1))}</style>', HTML_TEMPLATE))]
+
+
+def _render_template(**values) -> str:
+    return ''.join(literal + (str(values[field]) if field else '') for literal, field in _TEMPLATE_PARTS)
+
+
 LANG_NAMES = {
     'zh': 'Chinese (中文)',
     'zh-CN': 'Simplified Chinese (简体中文)',
@@ -1834,6 +2503,22 @@ LANG_NAMES = {
     'auto': 'Auto-detected'
 }
 
+_NUMBERED_PREFIXES = tuple(f'{i}.' for i in range(1, 10))
+
+
+def _iter_paragraphs(text: str):
+    """Yield the stripped, non-empty blocks between blank lines (like split('\\n\\n') without the list)"""
+    start = 0
+    while start <= len(text):
+        end = text.find('\n\n', start)
+        if end == -1:
+            end = len(text)
+        para = text[start:end].strip()
+        if para:
+            yield para
+        start = end + 2
+
+
 def build_html(article: Dict, translated_title: str, translated_text: str, config: Config, translated_html: Optional[str] = None) -> str:
     # No featured image - always use placeholder
     featured_image = '<div class="article-featured-placeholder">📰</div>'
@@ -1846,19 +2531,14 @@ def build_html(article: Dict, translated_title: str, translated_text: str, confi
         content_html = translated_html
     else:
         # Convert plain text to HTML with proper paragraph handling
-        # Split by double newlines (paragraph breaks)
-        paragraphs = translated_text.split('\n\n')
+        # Paragraphs are separated by double newlines; the text is escaped since it is not HTML
         content_parts = []
         
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-            
+        for para in _iter_paragraphs(translated_text):
             # Check if it's a heading (starts with # or is all caps)
             if para.startswith('#'):
                 # Markdown-style heading
-                heading_text = para.lstrip('#').strip()
+                heading_text = html_escape(para.lstrip('#').strip(), quote=False)
                 level = len(para) - len(para.lstrip('#'))
                 if level <= 1:
                     content_parts.append(f'<h2>{heading_text}</h2>')
@@ -1866,33 +2546,29 @@ def build_html(article: Dict, translated_title: str, translated_text: str, confi
                     content_parts.append(f'<h3>{heading_text}</h3>')
             elif para.isupper() and len(para) < 100:
                 # All caps short text = heading
-                content_parts.append(f'<h3>{para}</h3>')
+                content_parts.append(f'<h3>{html_escape(para, quote=False)}</h3>')
             elif para.startswith('- ') or para.startswith('* '):
                 # List item - collect consecutive list items
-                list_items = [para.lstrip('- ').lstrip('* ').strip()]
+                list_items = [html_escape(para.lstrip('- ').lstrip('* ').strip(), quote=False)]
                 content_parts.append(f'<ul><li>{list_items[0]}</li></ul>')
-            elif para.startswith(tuple(f'{i}.' for i in range(1, 10))):
+            elif para.startswith(_NUMBERED_PREFIXES):
                 # Numbered list
-                list_item = para.split('.', 1)[1].strip()
+                list_item = html_escape(para.split('.', 1)[1].strip(), quote=False)
                 content_parts.append(f'<ol><li>{list_item}</li></ol>')
             else:
                 # Regular paragraph - handle single line breaks within paragraph
-                para_html = para.replace('\n', '<br>')
+                para_html = html_escape(para, quote=False).replace('\n', '<br>')
                 content_parts.append(f'<p>{para_html}</p>')
         
         content_html = '\n'.join(content_parts)
     
-    # Get language display names
-    source_lang_display = LANG_NAMES.get(config.source_lang, config.source_lang)
-    target_lang_display = LANG_NAMES.get(config.target_lang, config.target_lang)
-    
-    return HTML_TEMPLATE.format(
-        title=translated_title,  # Use translated title
-        source_url=article['url'],
-        fetched=time.strftime('%B %d, %Y', time.localtime()),
+    return _render_template(
+        title=html_escape(translated_title),  # Use translated title
+        source_url=html_escape(article['url']),
+        fetched=config.fetched_date,
         lang=config.target_lang,
-        lang_display=target_lang_display,
-        source_lang_display=source_lang_display,
+        lang_display=config.target_lang_display,
+        source_lang_display=config.source_lang_display,
         featured_image=featured_image,
         content=content_html
     )
@@ -1905,32 +2581,39 @@ async def process_url(
     extractor: ArticleExtractor,
     translator: TranslatorBackend,
     config: Config,
-    cache: Optional[Cache]
+    cache: Optional[Cache],
+    extract_pool: Optional[Executor] = None,
+    robots: Optional[RobotsCache] = None
 ) -> bool:
     """Process single URL, return True if successful"""
     try:
         # Check cache
         if config.use_cache and cache:
-            cached = cache.get(url)
+            cached = await cache.get(url)
             if cached:
-                logger.info(f"✓ Using cached: {url}")
+                logger.info("✓ Using cached: %s", url)
                 return True
         
+        if robots is not None and not await robots.allowed(url):
+            logger.warning("🚫 Disallowed by robots.txt: %s", url)
+            return False
+        
         # Fetch HTML
-        logger.info(f"⬇ Fetching: {url}")
+        logger.info("⬇ Fetching: %s", url)
         html = await session.get(url)
         
         # 验证HTML内容
         if not html:
-            logger.error(f"❌ Received empty HTML from {url}")
+            logger.error("❌ Received empty HTML from %s", url)
             return False
         
         if not isinstance(html, str):
-            logger.error(f"❌ Invalid HTML type from {url}: {type(html)}")
+            logger.error("❌ Invalid HTML type from %s: %s", url, type(html))
             return False
         
-        # Extract article
-        article = extractor.extract(html, url)
+        # Extract article (CPU-bound parsing, run in extract_pool - or a thread when there is none -
+        # so the event loop keeps serving other fetches)
+        article = await asyncio.get_running_loop().run_in_executor(extract_pool, extractor.extract, html, url)
         article['url'] = url
         
         # 检查提取的内容
@@ -1938,91 +2621,99 @@ async def process_url(
         extracted_title = article.get('title', '')
         extracted_html = article.get('html')
         
-        logger.info(f"📝 Extracted title: {extracted_title[:100]}")
-        logger.info(f"📝 Extracted text length: {len(extracted_text)} chars")
-        logger.info(f"📝 Extracted HTML length: {len(extracted_html) if extracted_html else 0} chars")
+        logger.info("📝 Extracted title: %s", extracted_title[:100])
+        logger.info("📝 Extracted text length: %s chars", len(extracted_text))
+        logger.info("📝 Extracted HTML length: %s chars", len(extracted_html) if extracted_html else 0)
         if extracted_html:
-            logger.debug(f"📝 Extracted HTML preview: {extracted_html[:200]}")
+            logger.debug("📝 Extracted HTML preview: %s", extracted_html[:200])
         else:
-            logger.warning(f"⚠ No HTML content extracted, only plain text available")
+            logger.warning("⚠ No HTML content extracted, only plain text available")
         
         if not extracted_text or len(extracted_text) < 100:
-            logger.warning(f"⚠ Insufficient content extracted from {url}")
-            logger.warning(f"   Title: {extracted_title}")
-            logger.warning(f"   Text preview: {extracted_text[:200]}")
-            logger.warning(f"   HTML length: {len(html)} chars")
+            logger.warning("⚠ Insufficient content extracted from %s", url)
+            logger.warning("   Title: %s", extracted_title)
+            logger.warning("   Text preview: %s", extracted_text[:200])
+            logger.warning("   HTML length: %s chars", len(html))
             
             # 检查是否是验证页面
             if '验证' in html or 'captcha' in html.lower() or len(html) < 5000:
-                logger.error(f"❌ Likely blocked/verification page. HTML length: {len(html)}")
-                logger.error(f"   HTML preview: {html[:500]}")
+                logger.error("❌ Likely blocked/verification page. HTML length: %s", len(html))
+                logger.error("   HTML preview: %s", html[:500])
             
             # 保存HTML到文件以便调试
             try:
-                debug_dir = Path(config.output_dir) / '.debug'
+                debug_dir = config.out_dir / '.debug'
                 debug_dir.mkdir(parents=True, exist_ok=True)
                 debug_file = debug_dir / f"failed_extract_{safe_filename(url)}.html"
                 debug_file.write_text(html, encoding='utf-8')
-                logger.info(f"💾 Saved HTML to {debug_file} for debugging")
+                logger.info("💾 Saved HTML to %s for debugging", debug_file)
             except Exception as e:
-                logger.debug(f"Failed to save debug HTML: {e}")
+                logger.debug("Failed to save debug HTML: %s", e)
             
             return False
         
-        logger.info(f"✅ Successfully extracted {len(extracted_text)} chars from {url}")
+        logger.info("✅ Successfully extracted %s chars from %s", len(extracted_text), url)
+        # 原始页面不再需要：翻译可能要几分钟，别让每个并发任务都一直占着整页HTML
+        del html
         
-        # Translate/rewrite title
-        mode_text = "Rewriting" if config.rewrite_mode else "Translating"
-        logger.info(f"🔤 {mode_text} title: {article['title']}")
-        translated_title = await translator.translate(article['title'])
+        # The same article body under another URL (mirrors, tracking parameters) reuses the page already written
+        body_key = None
+        if config.use_cache and cache:
+            body_key = 'body:' + _hash_key(f"{config.target_lang}|{config.rewrite_mode}|{extracted_text}")
+            done = await cache.get(body_key)
+            if done and (Path(config.output_dir) / done['file']).exists():
+                logger.info("✓ Unchanged article body, reusing %s for %s", done['file'], url)
+                await cache.set(url, {**done, 'timestamp': time.time()})
+                return True
         
-        # Translate/rewrite content
-        logger.info(f"🌐 {mode_text} content: {url}")
-        translated_content = None
+        # Translate/rewrite title and content together (batched into shared requests where the backend supports it)
+        mode_text = "Rewriting" if config.rewrite_mode else "Translating"
+        logger.info("🔤 %s title: %s", mode_text, article['title'])
+        logger.info("🌐 %s content: %s", mode_text, url)
+        title_and_text = translator.translate_many([article['title'], article['text']])
         translated_html = None
         
         # Check if we have HTML content to preserve formatting
         original_html = article.get('html')
-        logger.debug(f"Extracted HTML length: {len(original_html) if original_html else 0}")
+        logger.debug("Extracted HTML length: %s", len(original_html) if original_html else 0)
         if original_html and original_html.strip():
-            # Use HTML translation to preserve structure and images
-            logger.info(f"📄 Translating HTML content (preserving structure and images, {len(original_html)} chars)")
+            # Use HTML translation to preserve structure and images (text is also translated, for fallback)
+            logger.info("📄 Translating HTML content (preserving structure and images, %s chars)", len(original_html))
             try:
-                translated_html = await translator.translate_html(original_html)
-                logger.info(f"✓ HTML translation completed ({len(translated_html) if translated_html else 0} chars)")
-                # Also translate text for fallback
-                translated_content = await translator.translate(article['text'])
+                (translated_title, translated_content), translated_html = await asyncio.gather(
+                    title_and_text, translator.translate_html(original_html))
+                logger.info("✓ HTML translation completed (%s chars)", len(translated_html) if translated_html else 0)
             except Exception as e:
-                logger.warning(f"HTML translation failed: {e}, falling back to text translation")
-                logger.warning(f"Exception details: {type(e).__name__}: {str(e)}")
+                logger.warning("HTML translation failed: %s, falling back to text translation", e)
+                logger.warning("Exception details: %s: %s", type(e).__name__, str(e))
                 import traceback
                 logger.debug(traceback.format_exc())
-                translated_content = await translator.translate(article['text'])
+                translated_title, translated_content = await translator.translate_many([article['title'], article['text']])
                 translated_html = None
         else:
             # Fallback to plain text translation
-            logger.info(f"⚠ No HTML content found, using plain text translation")
-            translated_content = await translator.translate(article['text'])
-            translated_html = None
+            logger.info("⚠ No HTML content found, using plain text translation")
+            translated_title, translated_content = await title_and_text
         
         # Build HTML with translated title
         html_content = build_html(article, translated_title, translated_content or article['text'], config, translated_html)
         
         # Save with translated title in filename
         slug = safe_filename(translated_title)
-        output_file = Path(config.output_dir) / f"{slug}.html"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding='utf-8')
+        output_file = config.out_dir / f"{slug}.html"  # main() has created the directory
+        await write_text_async(output_file, html_content)
         
         # Cache
         if config.use_cache and cache:
-            cache.set(url, {'title': translated_title, 'timestamp': time.time()})
+            entry = {'title': translated_title, 'file': output_file.name, 'timestamp': time.time()}
+            await cache.set(url, entry)
+            await cache.set(body_key, entry)
         
-        logger.info(f"✅ Saved: {output_file}")
+        logger.info("✅ Saved: %s", output_file)
         return True
         
     except Exception as e:
-        logger.error(f"❌ Failed {url}: {e}", exc_info=True)
+        logger.error("❌ Failed %s: %s", url, e, exc_info=True)
         return False
 
 
@@ -2030,51 +2721,86 @@ async def main(config: Config):
     # Read URLs
     urls_file = Path(config.urls_file)
     if not urls_file.exists():
-        logger.error(f"URLs file not found: {config.urls_file}")
+        logger.error("URLs file not found: %s", config.urls_file)
         return
     
-    urls = [line.strip() for line in urls_file.read_text().splitlines() if line.strip()]
-    logger.info(f"Found {len(urls)} URLs to process")
+    # 逐行读取，每行只 strip 一次
+    with urls_file.open(encoding='utf-8') as f:
+        urls = list(filter(None, map(str.strip, f)))
+    logger.info("Found %s URLs to process", len(urls))
     
     # Display configuration
     mode_text = "🎨 Rewrite & Optimize Mode" if config.rewrite_mode else "📝 Translation Mode"
-    logger.info(f"{mode_text}: {config.source_lang} → {config.target_lang}")
+    logger.info("%s: %s → %s", mode_text, config.source_lang, config.target_lang)
     
     # Setup
-    cache = Cache(Path(config.output_dir) / '.cache') if config.use_cache else None
+    config.out_dir.mkdir(parents=True, exist_ok=True)
+    cache = Cache(config.out_dir / '.cache') if config.use_cache else None
+    # Pages are read once per run, so keeping them in the memory LRU would only pin up to 1024 full HTML documents
+    page_cache = DiskCache(config.out_dir / '.cache' / 'pages', max_memory_items=0) if config.use_cache else None
     extractor = ArticleExtractor(config)
+    # 正文抽取是纯CPU解析，放到进程池里才能绕开GIL与抓取并行；只有一个URL时不值得启动进程池。
+    # 子进程用spawn启动：此时已有线程在运行（缓存的to_thread等），fork可能复制到被其他线程持有的锁
+    extract_pool = ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, config.max_concurrency, len(urls)),
+        mp_context=multiprocessing.get_context('spawn'),
+    ) if len(urls) > 1 else None
     translator = create_translator(config)
+    if config.use_cache:
+        translator.cache = DiskCache(config.out_dir / '.cache' / 'translations')
     
     # Process
-    # 创建带代理的ClientSession（如果配置了代理）
-    connector = None
+    # 创建ClientSession：连接池大小与并发数匹配，缓存DNS并保持连接复用
+    # 注意：aiohttp的proxy参数在get/post时传递，不是在connector中
+    connector = aiohttp.TCPConnector(
+        limit=config.max_concurrency * 2,
+        limit_per_host=config.max_concurrency,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+        ssl=False if config.proxy else True,
+    )
     if config.proxy:
-        # 注意：aiohttp的proxy参数在get/post时传递，不是在connector中
-        # 但我们可以创建一个connector用于其他配置
-        connector = aiohttp.TCPConnector(ssl=False)
-        logger.info(f"🌐 Using proxy for web scraping: {config.proxy}")
+        logger.info("🌐 Using proxy for web scraping: %s", config.proxy)
     else:
         logger.info("🌐 No proxy configured for web scraping")
     
-    async with aiohttp.ClientSession(connector=connector) as aio_session:
-        session = EnhancedRetrySession(aio_session, config)
-        
-        if tqdm:
-            tasks = [process_url(url, session, extractor, translator, config, cache) for url in urls]
-            results = await tqdm.gather(*tasks, desc="Processing articles")
-        else:
-            results = await asyncio.gather(*[
-                process_url(url, session, extractor, translator, config, cache) 
-                for url in urls
-            ])
+    try:
+        # read_bufsize: 文章页面可能有几百KB，增大读取缓冲区
+        async with aiohttp.ClientSession(connector=connector, read_bufsize=2 ** 20) as aio_session:
+            session = EnhancedRetrySession(aio_session, config, cache=page_cache)
+            robots = RobotsCache(aio_session, config) if config.respect_robots else None
+            
+            # max_concurrency workers pull URLs from a shared iterator, so only that many article
+            # coroutines (each holding its HTML, text and translation) exist at once, however long the list is
+            url_iter = iter(urls)
+            results: List[bool] = []
+            progress = tqdm(total=len(urls), desc="Processing articles") if tqdm else None
+            
+            async def _worker():
+                for url in url_iter:
+                    results.append(await process_url(url, session, extractor, translator, config, cache, extract_pool, robots))
+                    if progress is not None:
+                        progress.update(1)
+            
+            try:
+                await asyncio.gather(*[_worker() for _ in range(max(1, min(config.max_concurrency, len(urls))))])
+            finally:
+                if progress is not None:
+                    progress.close()
+    finally:
+        if extract_pool is not None:
+            extract_pool.shutdown()
+        await translator.aclose()
+        if cache:
+            cache.close()
     
     # Summary
     success_count = sum(1 for r in results if r)
-    logger.info(f"\n{'='*50}")
-    logger.info(f"✅ Successfully processed: {success_count}/{len(urls)}")
-    logger.info(f"❌ Failed: {len(urls) - success_count}")
-    logger.info(f"📁 Output directory: {config.output_dir}")
-    logger.info(f"{'='*50}")
+    logger.info("\n%s", '='*50)
+    logger.info("✅ Successfully processed: %s/%s", success_count, len(urls))
+    logger.info("❌ Failed: %s", len(urls) - success_count)
+    logger.info("📁 Output directory: %s", config.output_dir)
+    logger.info("%s", '='*50)
 
 
 # ----------------------------- CLI -----------------------------
@@ -2100,8 +2826,13 @@ if __name__ == '__main__':
     parser.add_argument('--browser-wait', type=int, default=3,
                        help='Wait time for JavaScript rendering (seconds, default: 3)')
     parser.add_argument('--concurrency', type=int, default=6, help='Max concurrent requests')
+    parser.add_argument('--translate-concurrency', type=int,
+                       help='Max concurrent translation requests (default: same as --concurrency)')
+    parser.add_argument('--translate-rpm', type=int,
+                       help='Max translation requests per minute (default: unlimited)')
     parser.add_argument('--timeout', type=int, default=30, help='Request timeout (seconds)')
     parser.add_argument('--no-cache', dest='cache', action='store_false', help='Disable caching')
+    parser.add_argument('--robots', action='store_true', help='Skip URLs disallowed by robots.txt')
     
     args = parser.parse_args()
     